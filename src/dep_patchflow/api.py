@@ -1,9 +1,11 @@
 """Optional FastAPI: POST /scan-report, POST /apply, GET /health."""
 
 import logging
-import tempfile
+import os
 from pathlib import Path
+from typing import Any
 
+import orjson
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
@@ -16,10 +18,19 @@ from .snyk_parser import parse_snyk_json
 
 logger = logging.getLogger(__name__)
 
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (faster than the stdlib encoder)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 app = FastAPI(
     title="dep-patchflow API",
     description="Snyk report → upgrade plan (Artifactory-gated) and apply with Patchwork",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Load config once at startup (override via env)
@@ -41,6 +52,8 @@ def get_settings() -> Settings:
     return _settings
 
 
+# Response shapes for the OpenAPI schema only; endpoints return plain dicts
+# so responses skip a Pydantic validation pass.
 class ScanReportResponse(BaseModel):
     plan_summary: dict
     upgrades_count: int
@@ -61,11 +74,11 @@ def health() -> dict:
     return {"status": "ok", "service": "dep-patchflow"}
 
 
-@app.post("/scan-report", response_model=ScanReportResponse)
+@app.post("/scan-report", response_model=None, responses={200: {"model": ScanReportResponse}})
 async def scan_report(
     file: UploadFile = File(..., description="Snyk JSON report file"),
     config_path: str | None = None,
-) -> ScanReportResponse:
+) -> dict:
     """Upload Snyk JSON report and generate upgrade plan.
 
     Parses the uploaded Snyk report, queries Artifactory for available versions,
@@ -76,75 +89,67 @@ async def scan_report(
         config_path: Optional path to config file (overrides default settings)
 
     Returns:
-        ScanReportResponse with plan summary and output file paths
+        Dict shaped like ScanReportResponse with plan summary and output file paths
 
     Raises:
         HTTPException: If file is not JSON or processing fails
     """
     if not file.filename or not file.filename.endswith(".json"):
         raise HTTPException(400, "Expected a .json file (Snyk test --json output)")
-    content = await file.read()
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-        f.write(content)
-        path = f.name
-    try:
-        settings = get_settings()
-        if config_path and Path(config_path).exists():
-            settings = Settings.from_yaml(config_path)
-        findings = parse_snyk_json(path)
-        plan = build_plan(findings, settings)
-        out_dir = Path("out")
-        json_path, md_path = write_reports(plan, out_dir=out_dir)
-        return ScanReportResponse(
-            plan_summary=plan.summary(),
-            upgrades_count=len(plan.upgrades),
-            skipped_count=len(plan.skipped),
-            output_json_path=str(json_path),
-            output_md_path=str(md_path),
-        )
-    finally:
-        Path(path).unlink(missing_ok=True)
-
-
-@app.post("/apply", response_model=ApplyResponse)
+    findings = parse_snyk_json(file.file)
+    settings = get_settings()
+    if config_path and Path(config_path).exists():
+        settings = Settings.from_yaml(config_path)
+    plan = build_plan(findings, settings)
+    out_dir = Path("out")
+    json_path, md_path = write_reports(plan, out_dir=out_dir)
+    return {
+        "plan_summary": plan.summary(),
+        "upgrades_count": len(plan.upgrades),
+        "skipped_count": len(plan.skipped),
+        "output_json_path": str(json_path),
+        "output_md_path": str(md_path),
+    }
+
+
+@app.post("/apply", response_model=None, responses={200: {"model": ApplyResponse}})
 async def apply(
     file: UploadFile = File(..., description="Snyk JSON report file"),
     project_dir: str = ".",
     run_patchwork: bool = True,
-) -> ApplyResponse:
+) -> dict:
     """Apply upgrade plan: update manifests, optionally run Patchwork."""
     if not file.filename or not file.filename.endswith(".json"):
         raise HTTPException(400, "Expected a .json file")
-    content = await file.read()
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-        f.write(content)
-        path = f.name
-    try:
-        settings = get_settings()
-        findings = parse_snyk_json(path)
-        plan = build_plan(findings, settings)
-        write_reports(plan, out_dir="out")
-        modified = apply_manifest_updates(plan, Path(project_dir))
-        pw_ran = False
-        if run_patchwork:
-            results = run_patchwork(settings, plan, project_dir=project_dir, dry_run=False)
-            pw_ran = len(results) > 0
-        return ApplyResponse(
-            success=True,
-            message="Plan applied",
-            modified_files=modified,
-            patchwork_run=pw_ran,
-        )
-    finally:
-        Path(path).unlink(missing_ok=True)
-
-
-def serve(host: str = "0.0.0.0", port: int = 8000) -> None:
+    findings = parse_snyk_json(file.file)
+    settings = get_settings()
+    plan = build_plan(findings, settings)
+    write_reports(plan, out_dir="out")
+    modified = apply_manifest_updates(plan, Path(project_dir))
+    pw_ran = False
+    if run_patchwork:
+        results = run_patchwork(settings, plan, project_dir=project_dir, dry_run=False)
+        pw_ran = len(results) > 0
+    return {
+        "success": True,
+        "message": "Plan applied",
+        "modified_files": modified,
+        "patchwork_run": pw_ran,
+    }
+
+
+def serve(host: str = "0.0.0.0", port: int = 8000, workers: int | None = 1) -> None:
     """Start FastAPI server with uvicorn.
 
     Args:
         host: Host to bind to (default: "0.0.0.0" for all interfaces)
         port: Port to listen on (default: 8000)
+        workers: Number of worker processes (default: 1); None for one per CPU
     """
     import uvicorn
-    uvicorn.run("dep_patchflow.api:app", host=host, port=port, reload=False)
+    uvicorn.run(
+        "dep_patchflow.api:app",
+        host=host,
+        port=port,
+        workers=workers if workers is not None else (os.cpu_count() or 1),
+    )
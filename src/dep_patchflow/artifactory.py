@@ -1,39 +1,92 @@
 """JFrog Artifactory client: list available package versions (AQL or metadata)."""
 
+import asyncio
+import atexit
+import base64
+import json
 import logging
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import httpx
-from packaging.version import Version as PyVersion
+import orjson
+from cachetools import TTLCache
 
 from .config import Settings
 from .models import Ecosystem
+from .version_policy import _sort_python_versions
 
 logger = logging.getLogger(__name__)
 
-# In-memory cache: (ecosystem, package_name) -> list[str] of versions
-_version_cache: dict[tuple[str, str], list[str]] = {}
-_cache_miss_reasons: dict[tuple[str, str], str] = {}
+# Seconds an empty lookup result is trusted (memory and disk)
+_NEGATIVE_TTL = 60.0
+
+# In-memory caches: (ecosystem, package_name) -> versions / reason for an empty result.
+# Bounded so a long-running API server doesn't grow without limit; misses expire
+# quickly so a transient Artifactory outage isn't remembered for long.
+_version_cache: TTLCache[tuple[str, str], list[str]] = TTLCache(maxsize=10_000, ttl=3600)
+_cache_miss_reasons: TTLCache[tuple[str, str], str] = TTLCache(maxsize=1_000, ttl=_NEGATIVE_TTL)
+# TTLCache is not thread-safe; lookups may run on worker threads
+_cache_lock = threading.Lock()
+
+# On-disk cache shared across runs. Listings expire after
+# Settings.artifactory_disk_cache_ttl so newly published fix versions are picked up;
+# empty results expire after _NEGATIVE_TTL.
+_disk_cache_path = Path.home() / ".cache" / "dep-patchflow" / "versions.sqlite"
+# One connection per process (opened on first use), serialized by _disk_lock
+_disk_conn: sqlite3.Connection | None = None
+_disk_conn_path: Path | None = None
+_disk_lock = threading.Lock()
+
+# MAJOR.MINOR.PATCH[-prerelease][+build], optional leading "v"
+_NPM_RE = re.compile(r"^v?(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?$")
+
+# A path segment starting with a digit and containing a dot (e.g. "2.28.0")
+_DOTTED_SEGMENT_RE = re.compile(r"(?:^|/)(\d[^/]*\.[^/]*)(?=/|$)")
+
+# Shared HTTP client: reused across lookups so keep-alive connections are pooled
+_client: httpx.Client | None = None
+_client_headers: dict[str, str] | None = None
+_client_lock = threading.Lock()
+_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Max in-flight requests for list_versions_bulk
+_BULK_CONCURRENCY = 32
 
 
 def _sort_python(versions: list[str]) -> list[str]:
     """Sort Python package versions using PEP 440 versioning rules.
 
+    Delegates to version_policy so listings and version selection share one
+    parse pool.
+
     Args:
         versions: List of version strings to sort
 
     Returns:
         Sorted list of versions (invalid versions placed at start with "0")
     """
-    parsed: list[tuple[PyVersion, str]] = []
-    for v in versions:
-        try:
-            parsed.append((PyVersion(v), v))
-        except Exception:
-            # Invalid versions sorted as "0" (placed at start)
-            parsed.append((PyVersion("0"), v))
-    parsed.sort(key=lambda x: x[0])
-    return [v for _, v in parsed]
+    return _sort_python_versions(versions)
+
+
+@lru_cache(maxsize=4096)
+def _node_sort_key(v: str) -> tuple[int, int, int, bool, str]:
+    """Sort key for a Node.js version (memoized).
+
+    MAJOR.MINOR.PATCH compare numerically and a pre-release sorts before its
+    release; versions that don't match sort first, ordered as strings.
+    """
+    m = _NPM_RE.match(v)
+    if m is None:
+        return (0, 0, 0, False, v)
+    pre = m[4] or ""
+    return (int(m[1]), int(m[2]), int(m[3]), not pre, pre)
 
 
 def _sort_node(versions: list[str]) -> list[str]:
@@ -43,24 +96,20 @@ def _sort_node(versions: list[str]) -> list[str]:
         versions: List of version strings to sort
 
     Returns:
-        Sorted list of versions (falls back to string sort if semver unavailable)
+        Sorted list of versions (invalid versions placed at start)
     """
-    try:
-        import semver
-        parsed: list[tuple[tuple[int, int, int], str]] = []
-        for v in versions:
-            try:
-                # Remove 'v' prefix if present (e.g., "v1.2.3" -> "1.2.3")
-                ver = semver.VersionInfo.parse(v.lstrip("v"))
-                parsed.append(((ver.major, ver.minor, ver.patch), v))
-            except Exception:
-                # Invalid versions sorted as (0, 0, 0)
-                parsed.append(((0, 0, 0), v))
-        parsed.sort(key=lambda x: x[0])
-        return [v for _, v in parsed]
-    except Exception:
-        # Fallback to string sort if semver library unavailable
-        return sorted(versions)
+    return sorted(versions, key=_node_sort_key)
+
+
+@lru_cache(maxsize=8)
+def _auth_headers_cached(token: str, username: str, password: str) -> dict[str, str]:
+    """Build the Authorization header for one set of credentials (memoized)."""
+    if token:
+        return {"Authorization": f"Bearer {token}"}
+    if username and password:
+        cred = base64.b64encode(f"{username}:{password}".encode()).decode()
+        return {"Authorization": f"Basic {cred}"}
+    return {}
 
 
 def _auth_headers(settings: Settings) -> dict[str, str]:
@@ -70,49 +119,67 @@ def _auth_headers(settings: Settings) -> dict[str, str]:
     1. Bearer token authentication
     2. Basic authentication (username/password)
 
+    The header dict is built once per distinct set of credentials and shared
+    between calls; callers must not mutate it.
+
     Args:
         settings: Settings object containing Artifactory credentials
 
     Returns:
         Dictionary with Authorization header, or empty dict if no credentials
     """
-    if settings.artifactory_token:
-        return {"Authorization": f"Bearer {settings.artifactory_token}"}
-    if settings.artifactory_username and settings.artifactory_password:
-        import base64
-        cred = base64.b64encode(
-            f"{settings.artifactory_username}:{settings.artifactory_password}".encode()
-        ).decode()
-        return {"Authorization": f"Basic {cred}"}
-    return {}
+    return _auth_headers_cached(
+        settings.artifactory_token,
+        settings.artifactory_username,
+        settings.artifactory_password,
+    )
 
 
-def list_versions_aql(
-    client: httpx.Client,
-    base_url: str,
-    repo: str,
-    ecosystem: Ecosystem,
-    package_name: str,
-) -> list[str]:
-    """List available package versions using Artifactory AQL (Artifactory Query Language).
+def _close_client() -> None:
+    """Close the shared HTTP client (registered with atexit)."""
+    global _client, _client_headers
+    if _client is not None:
+        _client.close()
+    _client = None
+    _client_headers = None
 
-    Queries Artifactory using AQL to find all versions of a package. Handles different
-    repository layouts for PyPI and npm packages.
+
+atexit.register(_close_client)
+
+
+def _get_client(settings: Settings) -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use.
+
+    The client is rebuilt if the auth headers change (e.g. a different config
+    file is loaded), so credentials from one Settings never leak into another.
+
+    Args:
+        settings: Settings object containing Artifactory credentials
+
+    Returns:
+        httpx.Client with auth headers and connection pooling configured
+    """
+    global _client, _client_headers
+    headers = _auth_headers(settings)
+    with _client_lock:
+        if _client is None or _client_headers != headers:
+            if _client is not None:
+                _client.close()
+            _client = httpx.Client(timeout=30.0, headers=headers, limits=_CLIENT_LIMITS, http2=True)
+            _client_headers = headers
+        return _client
+
+
+def _aql_query(repo: str, ecosystem: Ecosystem, package_name: str) -> str:
+    """Build the AQL request body for a package lookup.
 
     Args:
-        client: HTTP client with authentication headers already set
-        base_url: Artifactory base URL (e.g., "https://company.jfrog.io/artifactory")
         repo: Repository name (e.g., "pypi-remote", "npm-remote")
         ecosystem: Package ecosystem (PYTHON or NODE)
         package_name: Name of the package to query
 
     Returns:
-        Sorted list of version strings (empty list on error)
-
-    Note:
-        - PyPI: Looks for .whl files in paths containing package name
-        - npm: Looks for .tgz files in paths containing package name
-        - Versions are extracted from path segments and sorted appropriately
+        AQL query string ready to POST to /api/search/aql
     """
     if ecosystem == Ecosystem.PYTHON:
         # AQL: find items in repo where path contains package name
@@ -130,63 +197,177 @@ def list_versions_aql(
             "path": {"$match": f"*{package_name}*"},
             "name": {"$match": "*.tgz"},
         }
+    return f'items.find({orjson.dumps(aql).decode()}).include("path","name")'
 
-    url = f"{base_url.rstrip('/')}/api/search/aql"
-    body = "items.find(" + __aql_dict_to_query(aql) + ").include(\"path\",\"name\")"
-    try:
-        resp = client.post(url, content=body, headers={"Content-Type": "text/plain"})
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception as e:
-        logger.debug("AQL request failed for %s/%s: %s", ecosystem.value, package_name, e)
-        return []
 
+@lru_cache(maxsize=1024)
+def _after_package_re(package_name: str) -> re.Pattern[str]:
+    """Match the path segment that follows a segment equal to the package name."""
+    # Only the name is consumed; the capture sits in a lookahead so a repeated
+    # segment (pkg/pkg/9.0) still yields the version after every occurrence
+    return re.compile(rf"(?:^|/){re.escape(package_name)}(?=/([^/]+))")
+
+
+@lru_cache(maxsize=1024)
+def _npm_tarball_re(package_name: str) -> re.Pattern[str]:
+    """Match the version in an npm tarball name (package_name-1.2.3.tgz)."""
+    # Anchored to a whole path segment so "react" does not match preact-10.0.0.tgz
+    return re.compile(rf"(?:^|/){re.escape(package_name)}-(\d[^/]*?)\.tgz(?=/|$)")
+
+
+def _versions_from_aql(data: dict[str, Any], ecosystem: Ecosystem, package_name: str) -> list[str]:
+    """Extract sorted versions from an AQL search response.
+
+    Args:
+        data: Decoded AQL JSON response
+        ecosystem: Package ecosystem (PYTHON or NODE)
+        package_name: Name of the package that was queried
+
+    Returns:
+        Sorted list of version strings
+    """
     results = data.get("results") or []
     versions: set[str] = set()
+    pkg_lower = package_name.lower()
+    after_pkg = _after_package_re(package_name)
+    tarball = _npm_tarball_re(package_name)
     for r in results:
         path = (r.get("path") or "") + "/" + (r.get("name") or "")
+        # Every rule below needs the package name somewhere in the path
+        if pkg_lower not in path.lower():
+            continue
+        path = path.replace("\\", "/")
         # PyPI: path like pypi/requests/2.28.0/requests-2.28.0.whl -> 2.28.0
+        for cand in after_pkg.findall(path):
+            if cand != "-" and not cand.endswith((".whl", ".tgz")):
+                versions.add(cand)
         # NPM: path like npm/axios/-/axios-1.6.0.tgz -> 1.6.0
-        parts = path.replace("\\", "/").split("/")
-        for i, part in enumerate(parts):
-            if part == package_name and i + 1 < len(parts):
-                cand = parts[i + 1]
-                if cand != "-" and not cand.endswith(".whl") and not cand.endswith(".tgz"):
-                    versions.add(cand)
-            # npm: package_name-1.2.3.tgz
-            if package_name in part and ".tgz" in part:
-                rest = part.replace(f"{package_name}-", "").replace(".tgz", "").strip()
-                if rest and rest[0].isdigit():
-                    versions.add(rest)
-        # Try version from path segment that looks like semver/pep440
-        for part in parts:
-            if part and part[0].isdigit() and "." in part and package_name.lower() in path.lower():
-                versions.add(part)
+        versions.update(tarball.findall(path))
+        # Path segment that looks like semver/pep440
+        versions.update(_DOTTED_SEGMENT_RE.findall(path))
     out = list(versions)
     if ecosystem == Ecosystem.PYTHON:
         return _sort_python(out)
     return _sort_node(out)
 
 
-def __aql_dict_to_query(d: dict) -> str:
-    """Convert dictionary to AQL query string format.
+def list_versions_aql(
+    client: httpx.Client,
+    base_url: str,
+    repo: str,
+    ecosystem: Ecosystem,
+    package_name: str,
+) -> list[str]:
+    """List available package versions using Artifactory AQL (Artifactory Query Language).
+
+    Queries Artifactory using AQL to find all versions of a package. Handles different
+    repository layouts for PyPI and npm packages.
 
     Args:
-        d: Dictionary with AQL query parameters
+        client: HTTP client with authentication headers already set
+        base_url: Artifactory base URL (e.g., "https://company.jfrog.io/artifactory")
+        repo: Repository name (e.g., "pypi-remote", "npm-remote")
+        ecosystem: Package ecosystem (PYTHON or NODE)
+        package_name: Name of the package to query
 
     Returns:
-        AQL query string (e.g., '{"repo":"pypi-remote","path":{"$match":"*requests*"}}')
+        Sorted list of version strings (empty list on error)
 
     Note:
-        This is a private helper function for building AQL queries.
+        - PyPI: Looks for .whl files in paths containing package name
+        - npm: Looks for .tgz files in paths containing package name
+        - Versions are extracted from path segments and sorted appropriately
     """
-    parts = []
-    for k, v in d.items():
-        if isinstance(v, dict) and "$match" in v:
-            parts.append(f'"{k}":{{"$match":"{v["$match"]}"}}')
+    url = f"{base_url.rstrip('/')}/api/search/aql"
+    body = _aql_query(repo, ecosystem, package_name)
+    try:
+        resp = client.post(url, content=body, headers={"Content-Type": "text/plain"})
+        logger.debug("AQL %s/%s: %s %s", ecosystem.value, package_name, resp.http_version, resp.status_code)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+    except Exception as e:
+        logger.debug("AQL request failed for %s/%s: %s", ecosystem.value, package_name, e)
+        return []
+    return _versions_from_aql(data, ecosystem, package_name)
+
+
+async def _alist_versions_aql(
+    client: httpx.AsyncClient,
+    base_url: str,
+    repo: str,
+    ecosystem: Ecosystem,
+    package_name: str,
+) -> list[str]:
+    """Async counterpart of list_versions_aql (same query, same parsing)."""
+    url = f"{base_url.rstrip('/')}/api/search/aql"
+    body = _aql_query(repo, ecosystem, package_name)
+    try:
+        resp = await client.post(url, content=body, headers={"Content-Type": "text/plain"})
+        logger.debug("AQL %s/%s: %s %s", ecosystem.value, package_name, resp.http_version, resp.status_code)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+    except Exception as e:
+        logger.debug("AQL request failed for %s/%s: %s", ecosystem.value, package_name, e)
+        return []
+    return _versions_from_aql(data, ecosystem, package_name)
+
+
+def _metadata_urls(base_url: str, repo: str, ecosystem: Ecosystem, package_name: str) -> tuple[str, str]:
+    """Return (primary, fallback) metadata URLs for a package.
+
+    Args:
+        base_url: Artifactory base URL
+        repo: Repository name
+        ecosystem: Package ecosystem (PYTHON or NODE)
+        package_name: Name of the package to query
+
+    Returns:
+        Tuple of the API endpoint URL and the plain repository URL to try next
+    """
+    base = base_url.rstrip("/")
+    if ecosystem == Ecosystem.PYTHON:
+        # Many Artifactory PyPI setups: /repo/api/pypi/<repo>/packages/<name>/versions
+        return (
+            f"{base}/api/pypi/{repo}/packages/{package_name}/versions",
+            f"{base}/{repo}/pypi/{package_name}/",
+        )
+    # NPM: /artifactory/repo/package_name or /api/npm/npm-repo/package_name
+    return f"{base}/api/npm/npms/{repo}/{package_name}", f"{base}/{repo}/{package_name}"
+
+
+def _needs_metadata_fallback(resp: httpx.Response, ecosystem: Ecosystem) -> bool:
+    """Whether the primary metadata response should be retried on the fallback URL."""
+    if ecosystem == Ecosystem.PYTHON:
+        return resp.status_code == 404
+    return resp.status_code != 200
+
+
+def _versions_from_metadata(resp: httpx.Response, ecosystem: Ecosystem) -> list[str]:
+    """Extract sorted versions from a metadata response.
+
+    Args:
+        resp: Successful metadata response (JSON array or object)
+        ecosystem: Package ecosystem (PYTHON or NODE)
+
+    Returns:
+        Sorted list of version strings
+    """
+    if ecosystem == Ecosystem.PYTHON:
+        data = orjson.loads(resp.content) if resp.headers.get("content-type", "").startswith("application/json") else {}
+        if isinstance(data, list):
+            vers = data
+        elif isinstance(data, dict) and "versions" in data:
+            vers = data["versions"]
         else:
-            parts.append(f'"{k}":"{v}"')
-    return "{" + ",".join(parts) + "}"
+            vers = []
+        return _sort_python([str(v) for v in vers])
+    data = orjson.loads(resp.content)
+    versions = data.get("versions") or data.get("version") or {}
+    if isinstance(versions, dict):
+        return _sort_node(list(versions.keys()))
+    if isinstance(versions, list):
+        return _sort_node([str(v) for v in versions])
+    return []
 
 
 def list_versions_metadata(
@@ -216,46 +397,164 @@ def list_versions_metadata(
         - npm: Tries /api/npm/npms/{repo}/{name} first, then fallback URLs
         - Handles both JSON array and object responses
     """
-    base = base_url.rstrip("/")
-    if ecosystem == Ecosystem.PYTHON:
-        # Many Artifactory PyPI setups: /repo/api/pypi/<repo>/packages/<name>/versions
-        url = f"{base}/api/pypi/{repo}/packages/{package_name}/versions"
-        try:
-            resp = client.get(url)
-            if resp.status_code == 404:
-                url2 = f"{base}/{repo}/pypi/{package_name}/"
-                resp = client.get(url2)
-            resp.raise_for_status()
-            data = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else {}
-            if isinstance(data, list):
-                vers = data
-            elif isinstance(data, dict) and "versions" in data:
-                vers = data["versions"]
-            else:
-                vers = []
-            return _sort_python([str(v) for v in vers])
-        except Exception as e:
-            logger.debug("Metadata request failed for pypi %s: %s", package_name, e)
-            return []
-    else:
-        # NPM: /artifactory/repo/package_name or /api/npm/npm-repo/package_name
-        url = f"{base}/api/npm/npms/{repo}/{package_name}"
-        try:
-            resp = client.get(url)
-            if resp.status_code != 200:
-                url2 = f"{base}/{repo}/{package_name}"
-                resp = client.get(url2)
-            resp.raise_for_status()
-            data = resp.json()
-            versions = data.get("versions") or data.get("version") or {}
-            if isinstance(versions, dict):
-                return _sort_node(list(versions.keys()))
-            if isinstance(versions, list):
-                return _sort_node([str(v) for v in versions])
-            return []
-        except Exception as e:
-            logger.debug("Metadata request failed for npm %s: %s", package_name, e)
-            return []
+    url, url2 = _metadata_urls(base_url, repo, ecosystem, package_name)
+    try:
+        resp = client.get(url)
+        if _needs_metadata_fallback(resp, ecosystem):
+            resp = client.get(url2)
+        logger.debug("Metadata %s/%s: %s %s", ecosystem.value, package_name, resp.http_version, resp.status_code)
+        resp.raise_for_status()
+        return _versions_from_metadata(resp, ecosystem)
+    except Exception as e:
+        logger.debug("Metadata request failed for %s %s: %s", ecosystem.value, package_name, e)
+        return []
+
+
+async def _alist_versions_metadata(
+    client: httpx.AsyncClient,
+    base_url: str,
+    repo: str,
+    ecosystem: Ecosystem,
+    package_name: str,
+) -> list[str]:
+    """Async counterpart of list_versions_metadata (same URLs, same parsing)."""
+    url, url2 = _metadata_urls(base_url, repo, ecosystem, package_name)
+    try:
+        resp = await client.get(url)
+        if _needs_metadata_fallback(resp, ecosystem):
+            resp = await client.get(url2)
+        logger.debug("Metadata %s/%s: %s %s", ecosystem.value, package_name, resp.http_version, resp.status_code)
+        resp.raise_for_status()
+        return _versions_from_metadata(resp, ecosystem)
+    except Exception as e:
+        logger.debug("Metadata request failed for %s %s: %s", ecosystem.value, package_name, e)
+        return []
+
+
+def _repo_for(ecosystem: Ecosystem, settings: Settings) -> str:
+    """Return the Artifactory repository configured for an ecosystem."""
+    return settings.artifactory_repo_pypi if ecosystem == Ecosystem.PYTHON else settings.artifactory_repo_npm
+
+
+def _disk_source(ecosystem: Ecosystem, settings: Settings) -> str:
+    """Identify the Artifactory repo a disk cache entry came from."""
+    return f"{settings.artifactory_base_url.rstrip('/')}/{_repo_for(ecosystem, settings)}"
+
+
+def _disk_connect() -> sqlite3.Connection:
+    """Return the on-disk version cache connection, opening and creating it once.
+
+    Callers must hold _disk_lock.
+    """
+    global _disk_conn, _disk_conn_path
+    if _disk_conn is None or _disk_conn_path != _disk_cache_path:
+        _close_disk_cache()
+        _disk_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_disk_cache_path, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS versions ("
+            "source TEXT NOT NULL, eco TEXT NOT NULL, name TEXT NOT NULL, "
+            "versions_json TEXT NOT NULL, fetched_at REAL NOT NULL, "
+            "PRIMARY KEY (source, eco, name))"
+        )
+        _disk_conn, _disk_conn_path = conn, _disk_cache_path
+    return _disk_conn
+
+
+def _close_disk_cache() -> None:
+    """Close the on-disk cache connection (registered with atexit)."""
+    global _disk_conn, _disk_conn_path
+    if _disk_conn is not None:
+        _disk_conn.close()
+    _disk_conn = None
+    _disk_conn_path = None
+
+
+atexit.register(_close_disk_cache)
+
+
+def _disk_cache_get(source: str, eco: str, name: str, ttl: float) -> list[str] | None:
+    """Return cached versions from disk, or None if absent, expired or unreadable.
+
+    Args:
+        source: Artifactory repo the entry came from (see _disk_source)
+        eco: Ecosystem value
+        name: Package name
+        ttl: Seconds a non-empty listing is trusted
+    """
+    try:
+        with _disk_lock:
+            row = _disk_connect().execute(
+                "SELECT versions_json, fetched_at FROM versions WHERE source = ? AND eco = ? AND name = ?",
+                (source, eco, name),
+            ).fetchone()
+        if row is None:
+            return None
+        versions = json.loads(row[0])
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.debug("Disk cache read failed for %s/%s: %s", eco, name, e)
+        return None
+    if not isinstance(versions, list):
+        return None
+    if time.time() - row[1] > (ttl if versions else _NEGATIVE_TTL):
+        return None
+    return versions
+
+
+def _disk_cache_put(source: str, eco: str, name: str, versions: list[str]) -> None:
+    """Store a lookup result on disk (best effort)."""
+    try:
+        with _disk_lock:
+            conn = _disk_connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO versions VALUES (?, ?, ?, ?, ?)",
+                    (source, eco, name, json.dumps(versions), time.time()),
+                )
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("Disk cache write failed for %s/%s: %s", eco, name, e)
+
+
+def _cached_versions(package_name: str, ecosystem: Ecosystem, settings: Settings) -> list[str] | None:
+    """Look a package up in the in-memory cache, then on disk.
+
+    Returns:
+        Cached versions ([] for a recorded miss), or None if not cached
+    """
+    cache_key = (ecosystem.value, package_name)
+    with _cache_lock:
+        versions = _version_cache.get(cache_key)
+        reason = _cache_miss_reasons.get(cache_key)
+    if versions is not None:
+        return versions
+    if reason is not None:
+        logger.debug("Cache miss reason for %s: %s", cache_key, reason)
+        return []
+    if not settings.artifactory_base_url or not settings.artifactory_disk_cache:
+        return None
+    versions = _disk_cache_get(
+        _disk_source(ecosystem, settings), *cache_key, settings.artifactory_disk_cache_ttl
+    )
+    if versions is None:
+        return None
+    with _cache_lock:
+        if versions:
+            _version_cache[cache_key] = versions
+        else:
+            _cache_miss_reasons[cache_key] = "No versions returned (cached on disk)"
+    return versions
+
+
+def _record_versions(package_name: str, ecosystem: Ecosystem, settings: Settings, versions: list[str]) -> None:
+    """Store a lookup result in the memory and disk caches (or record why it is empty)."""
+    cache_key = (ecosystem.value, package_name)
+    with _cache_lock:
+        if not versions:
+            _cache_miss_reasons[cache_key] = "No versions returned (check repo layout or AQL)"
+        else:
+            _version_cache[cache_key] = versions
+    if settings.artifactory_disk_cache:
+        _disk_cache_put(_disk_source(ecosystem, settings), *cache_key, versions)
 
 
 def list_versions(
@@ -266,46 +565,230 @@ def list_versions(
 ) -> list[str]:
     """
     Return sorted list of versions available in Artifactory for the given package.
-    Uses in-memory cache by default. Returns [] on failure and records reason in _cache_miss_reasons.
+    Uses the in-memory and on-disk caches by default. Returns [] on failure and records
+    reason in _cache_miss_reasons.
     """
-    cache_key = (ecosystem.value, package_name)
-    if use_cache and cache_key in _version_cache:
-        return _version_cache[cache_key]
-    if use_cache and cache_key in _cache_miss_reasons:
-        logger.debug("Cache miss reason for %s: %s", cache_key, _cache_miss_reasons[cache_key])
-        return []
+    if use_cache:
+        cached = _cached_versions(package_name, ecosystem, settings)
+        if cached is not None:
+            return cached
 
     if not settings.artifactory_base_url:
-        _cache_miss_reasons[cache_key] = "ARTIFACTORY_BASE_URL not set"
+        with _cache_lock:
+            _cache_miss_reasons[(ecosystem.value, package_name)] = "ARTIFACTORY_BASE_URL not set"
         return []
 
-    repo = settings.artifactory_repo_pypi if ecosystem == Ecosystem.PYTHON else settings.artifactory_repo_npm
-    headers = _auth_headers(settings)
-    versions: list[str] = []
+    repo = _repo_for(ecosystem, settings)
+    client = _get_client(settings)
+    if getattr(settings, "artifactory_version_method", "aql") == "metadata":
+        versions = list_versions_metadata(
+            client, settings.artifactory_base_url, repo, ecosystem, package_name
+        )
+    else:
+        versions = list_versions_aql(
+            client, settings.artifactory_base_url, repo, ecosystem, package_name
+        )
+
+    _record_versions(package_name, ecosystem, settings, versions)
+    return versions
+
 
-    with httpx.Client(timeout=30.0, headers=headers) as client:
-        if getattr(settings, "artifactory_version_method", "aql") == "metadata":
-            versions = list_versions_metadata(
-                client, settings.artifactory_base_url, repo, ecosystem, package_name
-            )
+def _artifact_url(base_url: str, repo: str, ecosystem: Ecosystem, package_name: str, version: str) -> str:
+    """Return the URL of a single published version of a package.
+
+    Args:
+        base_url: Artifactory base URL
+        repo: Repository name
+        ecosystem: Package ecosystem (PYTHON or NODE)
+        package_name: Package name (npm scoped names like "@scope/pkg" supported)
+        version: Version to address
+
+    Returns:
+        PyPI version folder URL, or npm tarball URL
+    """
+    base = base_url.rstrip("/")
+    if ecosystem == Ecosystem.PYTHON:
+        return f"{base}/{repo}/{package_name}/{version}/"
+    tarball = package_name.rsplit("/", 1)[-1]
+    return f"{base}/{repo}/{package_name}/-/{tarball}-{version}.tgz"
+
+
+def version_exists(
+    client: httpx.Client,
+    base_url: str,
+    repo: str,
+    ecosystem: Ecosystem,
+    package_name: str,
+    version: str,
+) -> bool:
+    """Check whether one version of a package exists in Artifactory.
+
+    Issues a single HEAD request instead of listing every version of the
+    package, which is much cheaper for packages with a long history.
+
+    Args:
+        client: HTTP client with authentication headers already set
+        base_url: Artifactory base URL
+        repo: Repository name
+        ecosystem: Package ecosystem (PYTHON or NODE)
+        package_name: Name of the package
+        version: Version to check
+
+    Returns:
+        True if Artifactory answers 200, False otherwise (including errors)
+    """
+    url = _artifact_url(base_url, repo, ecosystem, package_name, version)
+    try:
+        resp = client.head(url)
+    except httpx.HTTPError as e:
+        logger.debug("HEAD failed for %s %s@%s: %s", ecosystem.value, package_name, version, e)
+        return False
+    return resp.status_code == 200
+
+
+def existing_versions(
+    package_name: str,
+    ecosystem: Ecosystem,
+    versions: list[str],
+    settings: Settings,
+) -> list[str]:
+    """Return the subset of versions that exist in Artifactory.
+
+    Answers from the version cache when the package listing is already known;
+    otherwise checks each version with version_exists.
+
+    Args:
+        package_name: Name of the package
+        ecosystem: Package ecosystem (PYTHON or NODE)
+        versions: Candidate versions (e.g. Snyk fix versions)
+        settings: Settings object with Artifactory configuration
+
+    Returns:
+        Versions confirmed to exist, in input order ([] if none or not configured)
+    """
+    if not settings.artifactory_base_url or not versions:
+        return []
+    cached = _cached_versions(package_name, ecosystem, settings)
+    if cached:
+        known = set(cached)
+        return [v for v in versions if v in known]
+    client = _get_client(settings)
+    repo = _repo_for(ecosystem, settings)
+    return [
+        v
+        for v in versions
+        if version_exists(client, settings.artifactory_base_url, repo, ecosystem, package_name, v)
+    ]
+
+
+async def _alist_versions(
+    client: httpx.AsyncClient,
+    package_name: str,
+    ecosystem: Ecosystem,
+    settings: Settings,
+) -> list[str]:
+    """Look up one package with the configured version method (async)."""
+    repo = _repo_for(ecosystem, settings)
+    if getattr(settings, "artifactory_version_method", "aql") == "metadata":
+        return await _alist_versions_metadata(
+            client, settings.artifactory_base_url, repo, ecosystem, package_name
+        )
+    return await _alist_versions_aql(
+        client, settings.artifactory_base_url, repo, ecosystem, package_name
+    )
+
+
+async def list_versions_bulk(
+    names: list[tuple[str, Ecosystem]],
+    settings: Settings,
+) -> dict[tuple[str, Ecosystem], list[str]]:
+    """Look up many packages concurrently and populate the version cache.
+
+    Packages already cached are answered from the cache; the rest are queried
+    in parallel over one AsyncClient, with at most _BULK_CONCURRENCY requests
+    in flight.
+
+    Args:
+        names: (package_name, ecosystem) pairs; duplicates are looked up once
+        settings: Settings object with Artifactory configuration
+
+    Returns:
+        Mapping of (package_name, ecosystem) to sorted versions ([] on failure)
+    """
+    unique = list(dict.fromkeys(names))
+    if not settings.artifactory_base_url:
+        return {pair: list_versions(pair[0], pair[1], settings) for pair in unique}
+
+    out: dict[tuple[str, Ecosystem], list[str]] = {}
+    pending: list[tuple[str, Ecosystem]] = []
+    for name, eco in unique:
+        cached = _cached_versions(name, eco, settings)
+        if cached is not None:
+            out[(name, eco)] = cached
         else:
-            versions = list_versions_aql(
-                client, settings.artifactory_base_url, repo, ecosystem, package_name
-            )
+            pending.append((name, eco))
+    if not pending:
+        return out
 
-    if not versions:
-        _cache_miss_reasons[cache_key] = "No versions returned (check repo layout or AQL)"
-    else:
-        _version_cache[cache_key] = versions
-    return versions
+    sem = asyncio.Semaphore(_BULK_CONCURRENCY)
+
+    async def _one(client: httpx.AsyncClient, name: str, eco: Ecosystem) -> list[str]:
+        async with sem:
+            return await _alist_versions(client, name, eco, settings)
+
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        headers=_auth_headers(settings),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        http2=True,
+    ) as client:
+        results = await asyncio.gather(*[_one(client, name, eco) for name, eco in pending])
+
+    for (name, eco), versions in zip(pending, results):
+        _record_versions(name, eco, settings, versions)
+        out[(name, eco)] = versions
+    return out
+
+
+def prefetch_versions(
+    names: list[tuple[str, Ecosystem]],
+    settings: Settings,
+) -> dict[tuple[str, Ecosystem], list[str]]:
+    """Synchronous wrapper around list_versions_bulk.
+
+    Safe to call from inside a running event loop (e.g. a FastAPI endpoint):
+    the coroutine is then driven on a worker thread with its own loop.
+
+    Args:
+        names: (package_name, ecosystem) pairs to look up
+        settings: Settings object with Artifactory configuration
+
+    Returns:
+        Mapping of (package_name, ecosystem) to sorted versions ([] on failure)
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(list_versions_bulk(names, settings))
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, list_versions_bulk(names, settings)).result()
 
 
 def clear_cache() -> None:
-    """Clear in-memory version cache and cache miss reasons.
+    """Clear the version caches (in-memory and on disk) and cache miss reasons.
 
     Useful for testing or when you need to force fresh API calls.
-    Clears both the version cache and the cache miss reasons dictionary.
+    Clears the version cache, the cache miss reasons dictionary and the
+    on-disk SQLite cache.
     """
-    global _version_cache, _cache_miss_reasons
-    _version_cache = {}
-    _cache_miss_reasons = {}
+    with _cache_lock:
+        _version_cache.clear()
+        _cache_miss_reasons.clear()
+    if _disk_cache_path.exists():
+        try:
+            with _disk_lock:
+                conn = _disk_connect()
+                with conn:
+                    conn.execute("DELETE FROM versions")
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Disk cache clear failed: %s", e)
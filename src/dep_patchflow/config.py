@@ -1,7 +1,9 @@
 """Pydantic settings: env + optional config file. No secrets in code."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import yaml
 from pydantic import Field
@@ -50,6 +52,11 @@ class Settings(BaseSettings):
     artifactory_version_method: Literal["aql", "metadata"] = Field(
         default="aql", alias="ARTIFACTORY_VERSION_METHOD"
     )
+    # On-disk version cache (~/.cache/dep-patchflow); listings are refetched after the TTL
+    artifactory_disk_cache: bool = Field(default=True, alias="ARTIFACTORY_DISK_CACHE")
+    artifactory_disk_cache_ttl: float = Field(
+        default=86_400.0, ge=0, alias="ARTIFACTORY_DISK_CACHE_TTL"
+    )
 
     # Snyk (optional when using file report)
     snyk_token: str = Field(default="", alias="SNYK_TOKEN")
@@ -75,22 +82,27 @@ class Settings(BaseSettings):
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "Settings":
-        """Load settings from config file; env vars override (pydantic-settings merge)."""
+        """Load settings from config file; env vars override (pydantic-settings merge).
+
+        The parsed file is cached per (path, mtime), so an unchanged file is read
+        once per process. Settings are built fresh on every call, so env vars and
+        ${VAR} references are always resolved against the current environment.
+        """
         path = Path(path)
-        if not path.exists():
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
             return cls()
-        data = yaml.safe_load(path.read_text()) or {}
-        policy = data.pop("policy", None) or {}
-        for k, v in policy.items():
-            key = f"policy_{k}"
-            if key not in data and v is not None:
-                data[key] = v
-        import os
-        for k, v in list(data.items()):
+        data = _read_yaml_config(str(path.resolve()), mtime_ns)
+        values: dict[str, Any] = {}
+        for k, v in data.items():
+            if k not in cls.model_fields:
+                continue
             if isinstance(v, str) and v.startswith("${") and v.endswith("}"):
                 var = v[2:-1].strip()
-                data[k] = os.environ.get(var, v)
-        return cls(**{k: v for k, v in data.items() if k in cls.model_fields})
+                v = os.environ.get(var, v)
+            values[k] = v
+        return cls(**values)
 
     def get_policy(self) -> PolicySettings:
         """Build PolicySettings from current settings.
@@ -108,3 +120,24 @@ class Settings(BaseSettings):
             prefer_stable_only=self.policy_prefer_stable_only if self.policy_prefer_stable_only is not None else True,
             dry_run=self.policy_dry_run if self.policy_dry_run is not None else False,
         )
+
+
+@lru_cache(maxsize=16)
+def _read_yaml_config(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a config file, flattening the policy block (cached by Settings.from_yaml).
+
+    Args:
+        path: Resolved path of the config file
+        mtime_ns: File modification time; part of the cache key only
+
+    Returns:
+        Top-level config values with policy.* as policy_* keys. The dict is
+        shared between callers; treat it as read-only.
+    """
+    data = yaml.safe_load(Path(path).read_text()) or {}
+    policy = data.pop("policy", None) or {}
+    for k, v in policy.items():
+        key = f"policy_{k}"
+        if key not in data and v is not None:
+            data[key] = v
+    return data
@@ -23,7 +23,7 @@ console = Console()
 DEFAULTS_YML = "defaults.yml"
 
 
-def _load_config(config_path: str | None) -> tuple[Settings, str | None]:
+def _load_config(config_path: str | None, disk_cache: bool = True) -> tuple[Settings, str | None]:
     """Load configuration from file or use defaults.
 
     Loads settings from specified config file, or falls back to defaults.yml
@@ -31,6 +31,8 @@ def _load_config(config_path: str | None) -> tuple[Settings, str | None]:
 
     Args:
         config_path: Optional path to config file (from --config option)
+        disk_cache: False to bypass the on-disk Artifactory version cache
+            (from --no-disk-cache)
 
     Returns:
         Tuple of (Settings object, config file path used or None)
@@ -40,15 +42,17 @@ def _load_config(config_path: str | None) -> tuple[Settings, str | None]:
         path = Path(config_path)
     elif Path(DEFAULTS_YML).exists():
         path = Path(DEFAULTS_YML)
-    if path is not None:
-        return Settings.from_yaml(path), str(path)
-    return Settings(), None
+    settings = Settings.from_yaml(path) if path is not None else Settings()
+    if not disk_cache:
+        settings = settings.model_copy(update={"artifactory_disk_cache": False})
+    return settings, str(path) if path is not None else None
 
 
 @app.command()
 def plan(
     snyk_report: Path = typer.Argument(..., help="Path to Snyk JSON report (snyk test --json)"),
     config: Path = typer.Option(None, "--config", "-c", help="Path to config (default: defaults.yml)"),
+    disk_cache: bool = typer.Option(True, "--disk-cache/--no-disk-cache", help="Use the on-disk Artifactory version cache"),
 ) -> None:
     """Generate upgrade plan from Snyk report without applying changes.
 
@@ -58,12 +62,13 @@ def plan(
     Args:
         snyk_report: Path to Snyk JSON report file
         config: Optional path to config file (default: defaults.yml)
+        disk_cache: Whether to read/write the on-disk Artifactory version cache
 
     Exits:
         Exit code 1 if Snyk report file not found
     """
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
-    settings, config_used = _load_config(str(config) if config else None)
+    settings, config_used = _load_config(str(config) if config else None, disk_cache)
 
     if not snyk_report.exists():
         console.print(f"[red]Snyk report not found: {snyk_report}[/red]")
@@ -100,6 +105,8 @@ def apply(
     config: Path = typer.Option(None, "--config", "-c", help="Path to config.yml"),
     project_dir: Path = typer.Option(Path("."), "--project-dir", "-d", help="Project root (for manifests + Patchwork)"),
     run_patchwork_cli: bool = typer.Option(True, "--patchwork/--no-patchwork", help="Run Patchwork DependencyUpgrade + AutoFix after applying manifest updates"),
+    parallel_patchwork: bool = typer.Option(False, "--parallel-patchwork", help="Run DependencyUpgrade and AutoFix concurrently (both touch the same working tree)"),
+    disk_cache: bool = typer.Option(True, "--disk-cache/--no-disk-cache", help="Use the on-disk Artifactory version cache"),
 ) -> None:
     """Apply upgrade plan: update manifest files and optionally run Patchwork.
 
@@ -113,6 +120,8 @@ def apply(
         config: Optional path to config file (default: defaults.yml)
         project_dir: Project root directory containing manifest files
         run_patchwork_cli: Whether to run Patchwork after updating manifests
+        parallel_patchwork: Whether to run the two patchflows concurrently
+        disk_cache: Whether to read/write the on-disk Artifactory version cache
 
     Note:
         - Respects dry_run policy setting (if enabled, no files are modified)
@@ -120,7 +129,7 @@ def apply(
         - Exits with code 1 if Snyk report file not found
     """
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
-    settings, config_used = _load_config(str(config) if config else None)
+    settings, config_used = _load_config(str(config) if config else None, disk_cache)
     policy = settings.get_policy()
     dry = policy.dry_run
 
@@ -149,8 +158,13 @@ def apply(
         console.print("[dim]No manifest files updated (none found or no Python/Node upgrades).[/dim]")
 
     if run_patchwork_cli:
-        console.print("Running Patchwork DependencyUpgrade then AutoFix...")
-        results = run_patchwork(settings, plan_result, project_dir=project_dir, dry_run=False)
+        if parallel_patchwork:
+            console.print("Running Patchwork DependencyUpgrade and AutoFix in parallel...")
+        else:
+            console.print("Running Patchwork DependencyUpgrade then AutoFix...")
+        results = run_patchwork(
+            settings, plan_result, project_dir=project_dir, dry_run=False, parallel=parallel_patchwork
+        )
         for i, name in enumerate(["DependencyUpgrade", "AutoFix"]):
             r = results[i] if i < len(results) else None
             if r is not None and getattr(r, "returncode", -1) != 0:
@@ -13,7 +13,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Ecosystem(str, Enum):
@@ -32,6 +32,10 @@ class Severity(str, Enum):
     CRITICAL = "critical"
 
 
+# Numeric rank per severity (higher is more severe), used for ordering and thresholds
+SEVERITY_RANK = {Severity.LOW: 0, Severity.MEDIUM: 1, Severity.HIGH: 2, Severity.CRITICAL: 3}
+
+
 class Finding(BaseModel):
     """Normalized vulnerability finding from Snyk (or other source).
 
@@ -44,15 +48,22 @@ class Finding(BaseModel):
         installed_version: Currently installed version (may be None)
         severity: Vulnerability severity level
         fix_versions: List of versions that fix this vulnerability (from Snyk)
-        raw: Original raw data from Snyk report (excluded from serialization)
+        raw: Original raw data from Snyk report, if attached (excluded from serialization)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     ecosystem: Ecosystem
     package_name: str
     installed_version: str | None = None
     severity: Severity
     fix_versions: list[str] = Field(default_factory=list)
-    raw: dict[str, Any] = Field(default_factory=dict, exclude=True)
+    raw: dict[str, Any] | None = Field(default=None, exclude=True)
+
+    @property
+    def severity_rank(self) -> int:
+        """SEVERITY_RANK of severity (derived on access, so it follows model_copy updates)."""
+        return SEVERITY_RANK[self.severity]
 
     def __hash__(self) -> int:
         """Generate hash for deduplication based on ecosystem, package name, and version."""
@@ -72,6 +83,8 @@ class UpgradeItem(BaseModel):
         reason: Explanation of why this version was chosen
     """
 
+    model_config = ConfigDict(frozen=True)
+
     package: str
     from_version: str
     to_version: str
@@ -93,6 +106,8 @@ class SkippedItem(BaseModel):
         severity: Vulnerability severity (optional, for reporting)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     package: str
     from_version: str | None
     ecosystem: Ecosystem
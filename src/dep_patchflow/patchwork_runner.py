@@ -1,39 +1,89 @@
 """Patchwork integration: update default.yml with API key, run Patchwork for upgrades/autofix."""
 
+import hashlib
 import logging
 import os
+import re
 import subprocess
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
+from typing import IO
 
+import orjson
 import yaml
 
 from .config import Settings
-from .models import UpgradePlan
+from .models import Ecosystem, UpgradePlan
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader/dumper when available (much faster than pure Python)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# default.yml files known to hold the current key: resolved path -> (mtime_ns, size, sha256(key))
+_YML_CACHE: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+_YML_CACHE_MAX = 32
+
+# Project name at the start of a requirements.txt line (PEP 508 name characters)
+_REQ_NAME_RE = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+_INSTRUCTIONS_HEADER = (
+    "# Patchflow: dependency upgrades (dep-patchflow plan)",
+    "",
+    "## Upgrades to apply",
+    "",
+)
+
+# Lines of each Patchwork output stream kept on the returned CompletedProcess
+_OUTPUT_TAIL_LINES = 2000
+
 
 def update_patchwork_default_yml(
     default_yml_path: str | Path,
     openai_api_key: str | None = None,
+    *,
+    _stat: os.stat_result | None = None,
 ) -> None:
     """
     Safely update Patchwork default.yml to set OpenAI key from env/config.
     Never writes secrets from code; only injects from argument (which should come from env).
+    Skips parsing when the file is unchanged since a previous update with the same key,
+    and skips the write when the file already holds the key.
+    _stat lets a caller that already stat'ed the file pass the result instead of re-statting.
     """
     path = Path(default_yml_path)
     key = openai_api_key or os.environ.get("OPENAI_API_KEY", "").strip()
     if not key:
         logger.warning("No OPENAI_API_KEY set; Patchwork may fail for LLM steps")
         return
-    if not path.exists():
-        logger.warning("Patchwork default.yml not found at %s; skipping update", path)
+    st = _stat
+    if st is None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            logger.warning("Patchwork default.yml not found at %s; skipping update", path)
+            return
+    cache_key = os.path.abspath(path)
+    key_hash = hashlib.sha256(key.encode()).hexdigest()
+    if _YML_CACHE.get(cache_key) == (st.st_mtime_ns, st.st_size, key_hash):
+        _YML_CACHE.move_to_end(cache_key)
+        logger.debug("%s already has openai_api_key; skipping update", path)
         return
-    data = yaml.safe_load(path.read_text()) or {}
+    data = yaml.load(path.read_text(), Loader=_YamlLoader) or {}
     # Patchwork accepts openai_api_key in defaults
-    data["openai_api_key"] = key
-    path.write_text(yaml.dump(data, default_flow_style=False, allow_unicode=True), encoding="utf-8")
-    logger.info("Updated %s with openai_api_key from config/env", path)
+    if data.get("openai_api_key") != key:
+        data["openai_api_key"] = key
+        path.write_text(yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True), encoding="utf-8")
+        st = path.stat()
+        logger.info("Updated %s with openai_api_key from config/env", path)
+    _YML_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, key_hash)
+    _YML_CACHE.move_to_end(cache_key)
+    if len(_YML_CACHE) > _YML_CACHE_MAX:
+        _YML_CACHE.popitem(last=False)
 
 
 def generate_patchflow_instructions(plan: UpgradePlan) -> str:
@@ -48,18 +98,23 @@ def generate_patchflow_instructions(plan: UpgradePlan) -> str:
     Returns:
         Markdown-formatted string with upgrade instructions
     """
-    lines = [
-        "# Patchflow: dependency upgrades (dep-patchflow plan)",
-        "",
-        "## Upgrades to apply",
-        "",
-    ]
-    for u in plan.upgrades:
-        lines.append(f"- {u.ecosystem.value}: {u.package} {u.from_version} -> {u.to_version}  # {u.reason}")
-    lines.extend(["", "## Skipped", ""])
-    for s in plan.skipped:
-        lines.append(f"- {s.package} ({s.from_version or '?'}): {s.reason}")
-    return "\n".join(lines)
+    return "\n".join(
+        chain(
+            _INSTRUCTIONS_HEADER,
+            (f"- {u.ecosystem.value}: {u.package} {u.from_version} -> {u.to_version}  # {u.reason}" for u in plan.upgrades),
+            ("", "## Skipped", ""),
+            (f"- {s.package} ({s.from_version or '?'}): {s.reason}" for s in plan.skipped),
+        )
+    )
+
+
+def _drain(pipe: IO[str], patchflow: str, level: int, tail: deque[str]) -> None:
+    """Forward a child pipe to the logger line by line, keeping only its tail."""
+    with pipe:
+        for line in pipe:
+            line = line.rstrip("\n")
+            logger.log(level, "Patchwork %s: %s", patchflow, line)
+            tail.append(line)
 
 
 def _run_patchwork_cmd(
@@ -68,48 +123,69 @@ def _run_patchwork_cmd(
     cwd: Path,
     timeout: int = 600,
 ) -> subprocess.CompletedProcess | None:
-    """Run a single Patchwork patchflow (DependencyUpgrade or AutoFix)."""
+    """Run a single Patchwork patchflow (DependencyUpgrade or AutoFix).
+
+    Output is streamed to the log as it is produced; the returned
+    CompletedProcess holds only the last _OUTPUT_TAIL_LINES lines of each
+    stream, so memory stays bounded on long LLM runs.
+    """
     cmd = ["patchwork", patchflow, f"openai_api_key={key}"]
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
             cwd=cwd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout,
         )
-        if result.stdout:
-            logger.info("Patchwork %s stdout: %s", patchflow, result.stdout[:2000])
-        if result.stderr:
-            logger.warning("Patchwork %s stderr: %s", patchflow, result.stderr[:2000])
-        if result.returncode != 0:
-            logger.error("Patchwork %s exited with code %s", patchflow, result.returncode)
-        return result
     except FileNotFoundError:
         logger.error(
             "patchwork CLI not found. Install with: pip install 'patchwork-cli[security]'"
         )
         return None
-    except subprocess.TimeoutExpired:
-        logger.error("Patchwork %s timed out after %ss", patchflow, timeout)
-        return None
     except Exception as e:
         logger.exception("Patchwork %s run failed: %s", patchflow, e)
         return None
 
+    out_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    err_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    drains = [
+        threading.Thread(target=_drain, args=(proc.stdout, patchflow, logging.INFO, out_tail), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, patchflow, logging.WARNING, err_tail), daemon=True),
+    ]
+    for t in drains:
+        t.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        logger.error("Patchwork %s timed out after %ss", patchflow, timeout)
+        return None
+    finally:
+        for t in drains:
+            t.join()
+    if returncode != 0:
+        logger.error("Patchwork %s exited with code %s", patchflow, returncode)
+    return subprocess.CompletedProcess(cmd, returncode, "\n".join(out_tail), "\n".join(err_tail))
+
 
 def run_patchwork(
     settings: Settings,
     plan: UpgradePlan,
     project_dir: str | Path | None = None,
     dry_run: bool = False,
+    parallel: bool = False,
 ) -> list[subprocess.CompletedProcess | None]:
     """
     Run Patchwork DependencyUpgrade and AutoFix (both required for apply).
     See: https://github.com/patched-codes/patchwork (DependencyUpgrade, AutoFix).
     - DependencyUpgrade: dependency upgrade flow (aligns with our Artifactory-gated plan).
     - AutoFix: vulnerability/code fixes (e.g. Semgrep-based).
+    If parallel: run both patchflows at the same time (roughly halves wall-clock time).
+    Off by default because both may create branches/commits in the same working tree.
     If dry_run: do not execute, return [].
+    Results are always in [DependencyUpgrade, AutoFix] order.
     """
     if dry_run:
         logger.info("Dry run: skipping Patchwork execution")
@@ -118,16 +194,22 @@ def run_patchwork(
     if not key:
         logger.warning("OPENAI_API_KEY not set; Patchwork LLM steps will fail")
     cwd = Path(project_dir or ".")
-    default_yml = getattr(settings, "patchwork_default_yml_path", "default.yml")
-    if Path(default_yml).exists():
-        update_patchwork_default_yml(default_yml, key)
+    default_yml = Path(getattr(settings, "patchwork_default_yml_path", "default.yml"))
+    try:
+        st = default_yml.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        # One stat serves both the existence check and the updater's cache key
+        update_patchwork_default_yml(default_yml, key, _stat=st)
 
-    results: list[subprocess.CompletedProcess | None] = []
-    # 1) DependencyUpgrade (dependency upgrades)
-    results.append(_run_patchwork_cmd("DependencyUpgrade", key, cwd))
-    # 2) AutoFix (vulnerability/code fixes)
-    results.append(_run_patchwork_cmd("AutoFix", key, cwd))
-    return results
+    # 1) DependencyUpgrade (dependency upgrades), 2) AutoFix (vulnerability/code fixes)
+    patchflows = ("DependencyUpgrade", "AutoFix")
+    if parallel:
+        # Each run just waits on its subprocess, so threads give real concurrency
+        with ThreadPoolExecutor(max_workers=len(patchflows)) as ex:
+            return list(ex.map(lambda pf: _run_patchwork_cmd(pf, key, cwd), patchflows))
+    return [_run_patchwork_cmd(pf, key, cwd) for pf in patchflows]
 
 
 def apply_manifest_updates(plan: UpgradePlan, project_dir: str | Path) -> list[str]:
@@ -151,12 +233,20 @@ def apply_manifest_updates(plan: UpgradePlan, project_dir: str | Path) -> list[s
     """
     project_dir = Path(project_dir)
     modified: list[str] = []
-    py_upgrades = {u.package: u.to_version for u in plan.upgrades if u.ecosystem.value == "python"}
-    node_upgrades = {u.package: u.to_version for u in plan.upgrades if u.ecosystem.value == "node"}
+    py_upgrades = {u.package: u.to_version for u in plan.upgrades if u.ecosystem == Ecosystem.PYTHON}
+    node_upgrades = {u.package: u.to_version for u in plan.upgrades if u.ecosystem == Ecosystem.NODE}
+    # One directory listing answers both existence checks
+    try:
+        with os.scandir(project_dir) as it:
+            names = {e.name for e in it if e.is_file()}
+    except OSError:
+        names = set()
 
     req_txt = project_dir / "requirements.txt"
-    if py_upgrades and req_txt.exists():
+    if py_upgrades and "requirements.txt" in names:
         lines = req_txt.read_text(encoding="utf-8", errors="replace").splitlines()
+        # Lowercase once so each line is a single dict lookup
+        py_lower = {name.lower(): (name, ver) for name, ver in py_upgrades.items()}
         new_lines = []
         changed = False
         for line in lines:
@@ -164,13 +254,13 @@ def apply_manifest_updates(plan: UpgradePlan, project_dir: str | Path) -> list[s
             if not stripped or stripped.startswith("#"):
                 new_lines.append(line)
                 continue
-            # Match package==version or package>=version etc.
-            pkg = stripped.split("[")[0].split("==")[0].split(">=")[0].split("~=")[0].strip().lower()
-            for name, ver in py_upgrades.items():
-                if name.lower() == pkg:
-                    new_lines.append(f"{name}=={ver}")
-                    changed = True
-                    break
+            # Leading project name, before any extras, specifier or marker
+            m = _REQ_NAME_RE.match(stripped)
+            pkg = m.group(1).lower() if m else ""
+            hit = py_lower.get(pkg)
+            if hit:
+                new_lines.append(f"{hit[0]}=={hit[1]}")
+                changed = True
             else:
                 new_lines.append(line)
         if changed:
@@ -178,23 +268,20 @@ def apply_manifest_updates(plan: UpgradePlan, project_dir: str | Path) -> list[s
             modified.append(str(req_txt))
 
     pkg_json = project_dir / "package.json"
-    if node_upgrades and pkg_json.exists():
-        import json as _json
-        data = _json.loads(pkg_json.read_text(encoding="utf-8", errors="replace"))
+    if node_upgrades and "package.json" in names:
+        data = orjson.loads(pkg_json.read_bytes())
         deps = data.get("dependencies") or {}
         dev = data.get("devDependencies") or {}
         changed = False
-        for name, ver in node_upgrades.items():
-            if name in deps:
-                deps[name] = f"^{ver}"  # caret for semver
-                changed = True
-            if name in dev:
-                dev[name] = f"^{ver}"
+        for target in (deps, dev):
+            # Key-view intersection walks whichever side is smaller, in C
+            for name in target.keys() & node_upgrades.keys():
+                target[name] = f"^{node_upgrades[name]}"  # caret for semver
                 changed = True
         if changed:
             data["dependencies"] = deps
             data["devDependencies"] = dev
-            pkg_json.write_text(_json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            pkg_json.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
             modified.append(str(pkg_json))
 
     return modified
@@ -1,30 +1,50 @@
 """Build UpgradePlan from findings + Artifactory + policy."""
 
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 
-from .artifactory import list_versions
+from .artifactory import existing_versions, list_versions, prefetch_versions
 from .config import PolicySettings, Settings
-from .models import Ecosystem, Finding, Severity, SkippedItem, UpgradeItem, UpgradePlan
-from .version_policy import choose_best_version, filter_prereleases
+from .models import SEVERITY_RANK, Ecosystem, Finding, Severity, SkippedItem, UpgradeItem, UpgradePlan
+from .version_policy import SortedListing, choose_best_version, precompute_artifactory
 
 logger = logging.getLogger(__name__)
 
-SEVERITY_ORDER = {Severity.LOW: 0, Severity.MEDIUM: 1, Severity.HIGH: 2, Severity.CRITICAL: 3}
+SEVERITY_ORDER = SEVERITY_RANK
 
+# Threads used for per-package HEAD checks against Artifactory
+_LOOKUP_WORKERS = 16
 
-def _severity_at_least(severity: Severity, min_severity: str) -> bool:
-    """Check if severity meets or exceeds minimum severity threshold.
+
+def _choose(
+    f: Finding,
+    af_versions: list[str],
+    policy: PolicySettings,
+    listing: SortedListing | None = None,
+) -> tuple[str | None, str]:
+    """Apply the version policy to one finding.
 
     Args:
-        severity: Severity level to check
-        min_severity: Minimum required severity (as string)
+        f: Finding to resolve
+        af_versions: Versions of the package known to exist in Artifactory
+        policy: Policy settings
+        listing: af_versions already filtered and sorted (shared per package)
 
     Returns:
-        True if severity >= min_severity, False otherwise
+        Tuple of (selected_version or None, reason)
     """
-    min_val = SEVERITY_ORDER.get(Severity(min_severity), 0)
-    return SEVERITY_ORDER.get(severity, 0) >= min_val
+    return choose_best_version(
+        f.installed_version or "0",
+        f.fix_versions,
+        af_versions,
+        allow_major=policy.allow_major,
+        prefer_stable_only=policy.prefer_stable_only,
+        ecosystem=f.ecosystem,
+        listing=listing,
+    )
 
 
 def build_plan(
@@ -64,13 +84,54 @@ def build_plan(
     upgrades: list[UpgradeItem] = []
     skipped: list[SkippedItem] = []
 
-    # Sort by severity (critical first), then by package name
-    ordered = sorted(
-        findings,
-        key=lambda f: (-SEVERITY_ORDER.get(f.severity, 0), f.package_name),
-    )
-
-    for f in ordered:
+    min_rank = SEVERITY_RANK[Severity(policy.min_severity)]
+
+    # Sort by severity (critical first), then by package name; both sorts are
+    # stable, so this matches a single (-rank, name) key without a Python lambda
+    ordered = sorted(findings, key=attrgetter("package_name"))
+    ordered.sort(key=attrgetter("severity_rank"), reverse=True)
+    # Ranks are descending, so the findings meeting min_severity form a prefix
+    n_eligible = sum(1 for f in ordered if f.severity_rank >= min_rank)
+    eligible, below = ordered[:n_eligible], ordered[n_eligible:]
+
+    # One lookup per package, however many CVEs it has. Findings are carried with
+    # their index in eligible, which keys the shortcut selections below.
+    groups: defaultdict[tuple[Ecosystem, str], list[tuple[int, Finding]]] = defaultdict(list)
+    for i, f in enumerate(eligible):
+        groups[(f.ecosystem, f.package_name)].append((i, f))
+
+    # When Snyk names fix versions, a HEAD per version usually settles the finding
+    # without listing the package's whole history. choose_best_version picks the
+    # same Snyk fix from this subset as it would from the full listing.
+    def _present(item: tuple[tuple[Ecosystem, str], list[tuple[int, Finding]]]) -> set[str]:
+        (eco, name), group = item
+        wanted = list(dict.fromkeys(v for _, f in group for v in f.fix_versions))
+        return set(existing_versions(name, eco, wanted, settings))
+
+    # HEAD checks are blocking I/O on the shared (thread-safe) client: fan out
+    with ThreadPoolExecutor(max_workers=_LOOKUP_WORKERS) as ex:
+        presents = list(ex.map(_present, groups.items()))
+
+    shortcuts: dict[int, tuple[str, str]] = {}
+    to_list: list[tuple[str, Ecosystem]] = []
+    for ((eco, name), group), present in zip(groups.items(), presents):
+        needs_listing = False
+        for i, f in group:
+            own = [v for v in f.fix_versions if v in present]
+            selected, reason = _choose(f, own, policy) if own else (None, "")
+            if selected is None:
+                needs_listing = True
+            else:
+                shortcuts[i] = (selected, reason)
+        if needs_listing:
+            to_list.append((name, eco))
+
+    # Resolve the remaining packages concurrently up front. The loop memoizes into
+    # the same per-plan map, so each package is listed at most once per plan.
+    vers_cache: dict[tuple[str, Ecosystem], list[str]] = prefetch_versions(to_list, settings)
+    listings: dict[tuple[str, Ecosystem], SortedListing] = {}
+
+    for i, f in enumerate(eligible):
         if len(upgrades) >= policy.max_upgrades_per_run:
             skipped.append(
                 SkippedItem(
@@ -82,27 +143,21 @@ def build_plan(
                 )
             )
             continue
-        if not _severity_at_least(f.severity, policy.min_severity):
-            skipped.append(
-                SkippedItem(
-                    package=f.package_name,
-                    from_version=f.installed_version,
-                    ecosystem=f.ecosystem,
-                    reason=f"severity {f.severity.value} below min_severity {policy.min_severity}",
-                    severity=f.severity,
-                )
-            )
-            continue
 
-        af_versions = list_versions(f.package_name, f.ecosystem, settings)
-        selected, reason = choose_best_version(
-            f.installed_version or "0",
-            f.fix_versions,
-            af_versions,
-            allow_major=policy.allow_major,
-            prefer_stable_only=policy.prefer_stable_only,
-            ecosystem=f.ecosystem,
-        )
+        if i in shortcuts:
+            selected, reason = shortcuts[i]
+        else:
+            ck = (f.package_name, f.ecosystem)
+            listing = listings.get(ck)
+            if listing is None:
+                af_versions = vers_cache.get(ck)
+                if af_versions is None:
+                    af_versions = vers_cache[ck] = list_versions(f.package_name, f.ecosystem, settings)
+                # Filter and sort the listing once for all findings of the package
+                listing = listings[ck] = precompute_artifactory(
+                    af_versions, f.ecosystem, policy.prefer_stable_only
+                )
+            selected, reason = _choose(f, [], policy, listing)
         if selected is None:
             skipped.append(
                 SkippedItem(
@@ -136,6 +191,17 @@ def build_plan(
             )
         )
 
+    skipped.extend(
+        SkippedItem(
+            package=f.package_name,
+            from_version=f.installed_version,
+            ecosystem=f.ecosystem,
+            reason=f"severity {f.severity.value} below min_severity {policy.min_severity}",
+            severity=f.severity,
+        )
+        for f in below
+    )
+
     return UpgradePlan(
         upgrades=upgrades,
         skipped=skipped,
@@ -1,8 +1,10 @@
 """Write upgrade_summary.json and upgrade_summary.md to out/."""
 
-import json
+import io
 from pathlib import Path
 
+import orjson
+
 from .models import UpgradePlan
 
 
@@ -31,45 +33,44 @@ def write_reports(plan: UpgradePlan, out_dir: str | Path = "out") -> tuple[Path,
     json_path = out / "upgrade_summary.json"
     payload = {
         "summary": plan.summary(),
-        "upgrades": [u.model_dump() for u in plan.upgrades],
-        "skipped": [s.model_dump() for s in plan.skipped],
+        # mode="json" emits enum values directly, no fix-up pass needed
+        "upgrades": [u.model_dump(mode="json") for u in plan.upgrades],
+        "skipped": [s.model_dump(mode="json") for s in plan.skipped],
     }
-    for u in payload["upgrades"]:
-        u["ecosystem"] = u["ecosystem"].value if hasattr(u["ecosystem"], "value") else u["ecosystem"]
-    for s in payload["skipped"]:
-        s["ecosystem"] = s["ecosystem"].value if hasattr(s["ecosystem"], "value") else s["ecosystem"]
-        if s.get("severity"):
-            s["severity"] = s["severity"].value if hasattr(s["severity"], "value") else s["severity"]
-    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
     md_path = out / "upgrade_summary.md"
-    md_lines = [
-        "# Dependency Upgrade Summary",
-        "",
-        f"Generated: {plan.generated_at.isoformat()}",
-        "",
-        "## Summary",
-        "",
-        f"- **Upgrades:** {len(plan.upgrades)}",
-        f"- **Skipped:** {len(plan.skipped)}",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(
+        "# Dependency Upgrade Summary\n\n"
+        f"Generated: {plan.generated_at.isoformat()}\n\n"
+        "## Summary\n\n"
+        f"- **Upgrades:** {len(plan.upgrades)}\n"
+        f"- **Skipped:** {len(plan.skipped)}\n\n"
+    )
     if plan.snyk_report_path:
-        md_lines.append(f"- **Snyk report:** `{plan.snyk_report_path}`")
+        buf.write(f"- **Snyk report:** `{plan.snyk_report_path}`\n")
     if plan.config_path:
-        md_lines.append(f"- **Config:** `{plan.config_path}`")
-    md_lines.extend(["", "## Snyk recommended vs Artifactory available", ""])
-    md_lines.append("Upgrades below were chosen only from versions that exist in Artifactory.")
-    md_lines.append("")
-    md_lines.append("| Package | From | To | Ecosystem | Reason |")
-    md_lines.append("|---------|------|-----|----------|--------|")
-    for u in plan.upgrades:
-        md_lines.append(f"| {u.package} | {u.from_version} | {u.to_version} | {u.ecosystem.value} | {u.reason} |")
-    md_lines.extend(["", "## Skipped dependencies", ""])
-    md_lines.append("| Package | From | Ecosystem | Reason |")
-    md_lines.append("|---------|------|----------|--------|")
-    for s in plan.skipped:
-        md_lines.append(f"| {s.package} | {s.from_version or '-'} | {s.ecosystem.value} | {s.reason} |")
-    md_path.write_text("\n".join(md_lines), encoding="utf-8")
+        buf.write(f"- **Config:** `{plan.config_path}`\n")
+    buf.write(
+        "\n## Snyk recommended vs Artifactory available\n\n"
+        "Upgrades below were chosen only from versions that exist in Artifactory.\n\n"
+        "| Package | From | To | Ecosystem | Reason |\n"
+        "|---------|------|-----|----------|--------|\n"
+    )
+    buf.writelines(
+        f"| {u.package} | {u.from_version} | {u.to_version} | {u.ecosystem.value} | {u.reason} |\n"
+        for u in plan.upgrades
+    )
+    buf.write(
+        "\n## Skipped dependencies\n\n"
+        "| Package | From | Ecosystem | Reason |\n"
+        "|---------|------|----------|--------|"
+    )
+    # Rows are newline-prefixed so the file keeps no trailing newline
+    buf.writelines(
+        f"\n| {s.package} | {s.from_version or '-'} | {s.ecosystem.value} | {s.reason} |" for s in plan.skipped
+    )
+    md_path.write_text(buf.getvalue(), encoding="utf-8")
 
     return json_path, md_path
@@ -1,8 +1,15 @@
 """Parse Snyk test --json output into normalized Finding list."""
 
-import json
 import logging
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable
 from pathlib import Path
+from typing import IO, Any
+
+import ijson
+import orjson
 
 from .models import Ecosystem, Finding, Severity
 
@@ -21,7 +28,25 @@ PKG_MANAGER_TO_ECOSYSTEM = {
     "npm": Ecosystem.NODE,
     "yarn": Ecosystem.NODE,
     "pnpm": Ecosystem.NODE,
+    # Language names, so package manager and language share one lookup
+    "python": Ecosystem.PYTHON,
+    "node": Ecosystem.NODE,
+    "javascript": Ecosystem.NODE,
+    "nodejs": Ecosystem.NODE,
+}
+# Severity lookup for the casings Snyk emits, so they skip str.lower()/strip()
+_SEV_FAST = {
+    **SEVERITY_MAP,
+    **{k.upper(): v for k, v in SEVERITY_MAP.items()},
+    **{k.capitalize(): v for k, v in SEVERITY_MAP.items()},
 }
+# Top-level report keys read during the streaming metadata pass
+_REPORT_META_KEYS = frozenset({"packageManager", "package_manager", "language"})
+# Reports smaller than this are decoded in one orjson call; larger ones are streamed
+_STREAM_MIN_BYTES = 8 * 1024 * 1024
+# Parsed report files keyed by (resolved path, mtime_ns, size); LRU-bounded
+_PARSE_CACHE: OrderedDict[tuple[str, int, int], list[Finding]] = OrderedDict()
+_PARSE_CACHE_MAX = 16
 
 
 def _normalize_severity(s: str | None) -> Severity:
@@ -35,8 +60,8 @@ def _normalize_severity(s: str | None) -> Severity:
     """
     if not s:
         return Severity.MEDIUM
-    key = str(s).lower().strip()
-    return SEVERITY_MAP.get(key, Severity.MEDIUM)
+    hit = _SEV_FAST.get(s) if isinstance(s, str) else None
+    return hit or SEVERITY_MAP.get(str(s).strip().lower(), Severity.MEDIUM)
 
 
 def _ecosystem_from_package_manager(pm: str | None, language: str | None) -> Ecosystem:
@@ -49,16 +74,12 @@ def _ecosystem_from_package_manager(pm: str | None, language: str | None) -> Eco
     Returns:
         Ecosystem enum value, defaults to PYTHON if unknown
     """
-    if pm:
-        pm_lower = str(pm).lower()
-        if pm_lower in PKG_MANAGER_TO_ECOSYSTEM:
-            return PKG_MANAGER_TO_ECOSYSTEM[pm_lower]
-    if language:
-        lang = str(language).lower()
-        if lang == "python":
-            return Ecosystem.PYTHON
-        if lang in ("node", "javascript", "nodejs"):
-            return Ecosystem.NODE
+    for value in (pm, language):
+        if value:
+            hit = PKG_MANAGER_TO_ECOSYSTEM.get(value) if isinstance(value, str) else None
+            hit = hit or PKG_MANAGER_TO_ECOSYSTEM.get(str(value).lower())
+            if hit:
+                return hit
     return Ecosystem.PYTHON  # fallback
 
 
@@ -77,72 +98,167 @@ def _extract_fix_versions(vuln: dict) -> list[str]:
     Returns:
         List of version strings that fix the vulnerability (deduplicated, ordered)
     """
-    fix_versions: list[str] = []
+    out: list[str] = []
+    seen: set[str] = set()
+
+    def _add(v: str) -> None:
+        # Deduplicated in one pass, preserving first-seen order; interned because
+        # each one is looked up against Artifactory listings built from interned strings
+        s = v.strip()
+        if s and s.lower() not in ("false", "null") and s not in seen:
+            s = sys.intern(s)
+            seen.add(s)
+            out.append(s)
+
     # upgradePath can be array of package@version; last is often the fix
     path = vuln.get("upgradePath")
     if isinstance(path, list) and path:
         for item in path:
-            if isinstance(item, str) and "@" in item:
-                _, ver = item.rsplit("@", 1)
-                if ver and ver.lower() not in ("false", "null"):
-                    fix_versions.append(ver.strip())
-            elif isinstance(item, str) and item and item.lower() not in ("false", "null"):
-                fix_versions.append(item.strip())
-    if not fix_versions and isinstance(path, str) and "@" in path:
-        _, ver = path.rsplit("@", 1)
-        if ver:
-            fix_versions.append(ver.strip())
+            if isinstance(item, str) and item:
+                _add(item.rsplit("@", 1)[1] if "@" in item else item)
+    if not out and isinstance(path, str) and "@" in path:
+        _add(path.rsplit("@", 1)[1])
     # Some reports have upgradePath with single version string
-    if not fix_versions and isinstance(path, str) and path and " " not in path:
-        fix_versions.append(path.strip())
+    if not out and isinstance(path, str) and path and " " not in path:
+        _add(path)
     # Alternative keys
     for key in ("fixedIn", "fixVersion", "patchedVersions"):
         val = vuln.get(key)
         if isinstance(val, list):
-            fix_versions.extend(str(v) for v in val if v)
+            for v in val:
+                if v:
+                    _add(str(v))
         elif isinstance(val, str) and val:
-            fix_versions.append(val.strip())
-    return list(dict.fromkeys(fix_versions))  # preserve order, dedupe
+            _add(val)
+    return out
 
 
-def parse_snyk_json(path: str | Path) -> list[Finding]:
-    """Parse Snyk JSON report into normalized Finding objects.
+def _load_report(src: bytes | IO[bytes], label: str = "<bytes>") -> tuple[dict[str, Any] | None, str]:
+    """Decode an in-memory Snyk report or a binary stream in one go.
 
-    Parses the output from `snyk test --json` and converts it into a list of
-    normalized Finding objects. Handles various Snyk report formats and
-    deduplicates findings by (ecosystem, package_name, installed_version).
+    Args:
+        src: The report's raw JSON content, or an open binary file
+        label: Name used in log messages for raw content
+
+    Returns:
+        Tuple of (decoded report or None on error, label used in log messages)
+    """
+    if hasattr(src, "read"):
+        label = str(getattr(src, "name", None) or "<stream>")
+        src = src.read()
+    try:
+        return orjson.loads(src), label
+    except orjson.JSONDecodeError:
+        pass
+    # orjson rejects invalid UTF-8 outright; reports were historically read as text
+    # with errors="replace", and a stray bad byte in embedded advisory text should
+    # not turn the whole report into an empty plan
+    try:
+        data = orjson.loads(bytes(src).decode("utf-8", errors="replace"))
+    except orjson.JSONDecodeError as e:
+        logger.exception("Invalid JSON in Snyk report: %s", e)
+        return None, label
+    logger.warning("Snyk report %s is not valid UTF-8; invalid bytes were replaced", label)
+    return data, label
+
+
+def _scan_report_meta(f: IO[bytes]) -> tuple[dict[str, Any], bool]:
+    """Stream over a report once to collect its top-level metadata.
+
+    Snyk writes packageManager/language after the vulnerabilities array, so
+    they have to be known before the array is streamed a second time.
 
     Args:
-        path: Path to Snyk JSON report file
+        f: Binary file positioned at the start of the report
 
     Returns:
-        List of Finding objects (empty list if file not found or invalid JSON)
+        Tuple of (top-level packageManager/package_manager/language values,
+        whether "vulnerabilities" is a JSON array)
+    """
+    meta: dict[str, Any] = {}
+    has_array = False
+    for prefix, event, value in ijson.parse(f):
+        if prefix in _REPORT_META_KEYS and event == "string":
+            meta[prefix] = value
+        elif prefix == "vulnerabilities" and event == "start_array":
+            has_array = True
+    return meta, has_array
 
-    Note:
-        - Logs warnings for missing files or invalid JSON
-        - Skips vulnerabilities without package names
-        - Deduplicates findings keeping the first occurrence
+
+def _parse_stream(f: IO[bytes], label: str) -> list[Finding]:
+    """Parse a seekable binary report, streaming it only when it is large.
+
+    Args:
+        f: Seekable binary file positioned at the start of the report
+        label: Name used in log messages
+
+    Returns:
+        List of Finding objects (empty list on invalid JSON)
     """
-    path = Path(path)
-    if not path.exists():
-        logger.warning("Snyk report file not found: %s", path)
-        return []
-    raw = path.read_text(encoding="utf-8", errors="replace")
+    size = f.seek(0, os.SEEK_END)
+    f.seek(0)
+    if size < _STREAM_MIN_BYTES:
+        data, _ = _load_report(f.read(), label)
+        return _findings_from_report(data, label) if data is not None else []
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
-        logger.exception("Invalid JSON in Snyk report: %s", e)
-        return []
+        meta, has_array = _scan_report_meta(f)
+        f.seek(0)
+        if has_array:
+            vulns = ijson.items(f, "vulnerabilities.item", use_float=True)
+            return _collect_findings(
+                vulns,
+                meta.get("packageManager") or meta.get("package_manager"),
+                meta.get("language"),
+                label,
+            )
+    except ijson.JSONError as e:
+        # Also raised for invalid UTF-8, which the full decode below tolerates
+        logger.debug("Streaming parse of %s failed, decoding in full: %s", label, e)
+    # Unusual layout (e.g. a single "vulnerability" object) or a stream error
+    f.seek(0)
+    data, _ = _load_report(f.read(), label)
+    return _findings_from_report(data, label) if data is not None else []
 
-    findings: list[Finding] = []
+
+def _findings_from_report(data: dict[str, Any], label: str) -> list[Finding]:
+    """Build findings from a fully decoded Snyk report.
+
+    Args:
+        data: Decoded report
+        label: Name used in log messages
+
+    Returns:
+        List of deduplicated Finding objects
+    """
     # Top-level vulnerabilities array (snyk test --json)
     vulns = data.get("vulnerabilities") or data.get("vulnerability") or []
     if not isinstance(vulns, list):
         vulns = [vulns] if vulns else []
+    return _collect_findings(
+        vulns,
+        data.get("packageManager") or data.get("package_manager"),
+        data.get("language"),
+        label,
+    )
+
+
+def _collect_findings(
+    vulns: Iterable[Any], package_manager: str | None, language: str | None, label: str
+) -> list[Finding]:
+    """Normalize vulnerability entries into deduplicated findings.
 
-    package_manager = data.get("packageManager") or data.get("package_manager")
-    language = data.get("language")
+    Args:
+        vulns: Vulnerability entries, either a list or a streaming iterator
+        package_manager: Report-level package manager, used when an entry has none
+        language: Report-level language, used when an entry has none
+        label: Name used in log messages
 
+    Returns:
+        List of Finding objects, first occurrence kept per
+        (ecosystem, package_name, installed_version)
+    """
+    findings: list[Finding] = []
+    seen: set[tuple[str, str, str]] = set()
     for v in vulns:
         if not isinstance(v, dict):
             logger.debug("Skipping non-dict vulnerability entry")
@@ -160,32 +276,76 @@ def parse_snyk_json(path: str | Path) -> list[Finding]:
             version = version[0] if version else ""
         version = (version or "").strip()
 
-        severity = _normalize_severity(v.get("severity"))
         ecosystem = _ecosystem_from_package_manager(
             v.get("packageManager") or package_manager,
             v.get("language") or language,
         )
-        fix_versions = _extract_fix_versions(v)
+        # Dedupe by (ecosystem, package_name, installed_version); keep first.
+        # Checked before building the Finding so duplicates skip validation.
+        key = (ecosystem.value, pkg, version)
+        if key in seen:
+            continue
+        seen.add(key)
         findings.append(
             Finding(
                 ecosystem=ecosystem,
                 package_name=pkg,
                 installed_version=version or None,
-                severity=severity,
-                fix_versions=fix_versions,
-                raw=v,
+                severity=_normalize_severity(v.get("severity")),
+                fix_versions=_extract_fix_versions(v),
             )
         )
 
-    # Dedupe by (ecosystem, package_name, installed_version); keep first
-    seen: set[tuple[str, str, str]] = set()
-    unique: list[Finding] = []
-    for f in findings:
-        key = (f.ecosystem.value, f.package_name, f.installed_version or "")
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(f)
+    logger.info("Parsed %d unique findings from %s", len(findings), label)
+    return findings
 
-    logger.info("Parsed %d unique findings from %s", len(unique), path)
-    return unique
+
+def parse_snyk_json(src: str | Path | bytes | IO[bytes]) -> list[Finding]:
+    """Parse Snyk JSON report into normalized Finding objects.
+
+    Parses the output from `snyk test --json` and converts it into a list of
+    normalized Finding objects. Handles various Snyk report formats and
+    deduplicates findings by (ecosystem, package_name, installed_version).
+
+    Args:
+        src: Path to Snyk JSON report file, the report content as bytes, or an
+            open binary file (e.g. an upload, parsed without a temp file)
+
+    Returns:
+        List of Finding objects (empty list if file not found or invalid JSON)
+
+    Note:
+        - Files and seekable streams of 8 MiB or more are parsed incrementally
+          with ijson, so memory stays bounded by one vulnerability entry;
+          smaller reports are decoded in a single (faster) orjson call
+        - Report files are cached by (path, mtime, size); an unchanged file is
+          not re-read. Callers get a fresh list of the (frozen) findings
+        - Logs warnings for missing files or invalid JSON
+        - Skips vulnerabilities without package names
+        - Deduplicates findings keeping the first occurrence
+    """
+    if isinstance(src, (bytes, bytearray, memoryview)):
+        data, label = _load_report(src)
+        return _findings_from_report(data, label) if data is not None else []
+    if hasattr(src, "read"):
+        if getattr(src, "seekable", lambda: False)():
+            return _parse_stream(src, str(getattr(src, "name", None) or "<stream>"))
+        data, label = _load_report(src)
+        return _findings_from_report(data, label) if data is not None else []
+    path = Path(src)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        logger.warning("Snyk report file not found: %s", path)
+        return []
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        _PARSE_CACHE.move_to_end(key)
+        return list(cached)
+    with path.open("rb") as f:
+        findings = _parse_stream(f, str(path))
+    _PARSE_CACHE[key] = findings
+    if len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+        _PARSE_CACHE.popitem(last=False)
+    return list(findings)
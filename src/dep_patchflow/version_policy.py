@@ -1,7 +1,14 @@
 """Version selection policy: filter pre-releases, choose best version from Snyk + Artifactory."""
 
 import logging
-from typing import Tuple
+import re
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Tuple
 
 from packaging.version import Version as PyVersion
 
@@ -9,6 +16,36 @@ from .models import Ecosystem
 
 logger = logging.getLogger(__name__)
 
+# Parsed Node version: (major, minor, patch, is_release, prerelease identifiers)
+NodeVersion = tuple[int, int, int, bool, tuple[tuple[int, int, str], ...]]
+
+# semver.org 2.0.0 grammar (the one python-semver implements)
+_SEMVER_RE = re.compile(
+    r"(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
+    r"(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?"
+    r"(?:\+[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*)?",
+    re.ASCII,
+)
+
+# Parsed versions shared across choose_best_version calls (None = unparseable).
+# Plain dicts: lookups are on the hot path and lru_cache bookkeeping is not needed;
+# a pool is simply dropped when it reaches _POOL_MAX entries.
+_PY_POOL: dict[str, PyVersion | None] = {}
+_NODE_POOL: dict[str, "NodeVersion | None"] = {}
+_POOL_MAX = 50_000
+_MISSING = object()
+
+# Sort key for Python versions that fail to parse
+_ZERO = PyVersion("0")
+# Pre-release markers (post releases included; Python .post is re-admitted below)
+_PRE_RE = re.compile(r"dev|alpha|a0|beta|b0|rc|pre|post|-", re.IGNORECASE)
+_POST_RE = re.compile(r"\.post", re.IGNORECASE)
+# Plain numeric versions whose major can be read without a full parse. Only shapes
+# the full parsers accept: any dotted release for PEP 440, exactly
+# MAJOR.MINOR.PATCH without leading zeros for semver.
+_PLAIN_PY_RE = re.compile(r"v?(\d+)(?:\.\d+)*", re.ASCII)
+_PLAIN_NODE_RE = re.compile(r"v?(0|[1-9]\d*)\.(?:0|[1-9]\d*)\.(?:0|[1-9]\d*)", re.ASCII)
+
 
 def filter_prereleases(versions: list[str], ecosystem: Ecosystem) -> list[str]:
     """Filter out pre-release versions, keeping only stable releases.
@@ -22,76 +59,157 @@ def filter_prereleases(versions: list[str], ecosystem: Ecosystem) -> list[str]:
         ecosystem: Package ecosystem (affects post-release handling)
 
     Returns:
-        List containing only stable version strings
+        List containing only stable version strings; versions itself when none
+        carries a pre-release marker
     """
-    out: list[str] = []
-    for v in versions:
-        v_lower = v.lower()
-        if any(
-            x in v_lower
-            for x in ("dev", "alpha", "a0", "beta", "b0", "rc", "pre", "post", "-")
-        ):
-            # Allow post releases like 1.0.0.post1 if we want; for prefer_stable_only we skip
-            if ecosystem == Ecosystem.PYTHON and ".post" in v_lower and v_lower.count("-") == 0:
-                out.append(v)
-                continue
-            continue
-        out.append(v)
-    return out
+    # Mature mirrors are often all-stable: one scan, no copy. any() stops at the
+    # first marker, so lists with pre-releases pay little before the real filter.
+    search = _PRE_RE.search
+    if not any(search(v) for v in versions):
+        return versions
+    if ecosystem == Ecosystem.PYTHON:
+        return _filter_python(versions)
+    return _filter_node(versions)
+
+
+def _filter_python(versions: list[str]) -> list[str]:
+    """Drop pre-releases, keeping .post releases that carry no "-"."""
+    search, post = _PRE_RE.search, _POST_RE.search
+    return [v for v in versions if not search(v) or (post(v) and "-" not in v)]
+
+
+def _filter_node(versions: list[str]) -> list[str]:
+    """Drop every version with a pre-release marker (Node has no post releases)."""
+    search = _PRE_RE.search
+    return [v for v in versions if not search(v)]
 
 
 def _parse_python_version(v: str) -> PyVersion | None:
     """Parse Python version string using PEP 440 rules.
 
+    Pooled process-wide (including None for invalid strings): the same
+    Artifactory listing is sorted and compared for every finding of a package.
+
     Args:
         v: Version string to parse
 
     Returns:
         PyVersion object if valid, None otherwise
     """
+    parsed = _PY_POOL.get(v, _MISSING)
+    if parsed is not _MISSING:
+        return parsed
     try:
-        return PyVersion(v)
+        parsed = PyVersion(v)
     except Exception:
-        return None
+        parsed = None
+    if len(_PY_POOL) >= _POOL_MAX:
+        _PY_POOL.clear()
+    _PY_POOL[v] = parsed
+    return parsed
+
 
+def _strip_v(v: str) -> str:
+    """Drop a single leading "v"; returns v itself (no copy) when there is none."""
+    return v[1:] if v.startswith("v") else v
 
-def _python_cmp(v1: str, v2: str) -> int:
-    """Compare two Python version strings.
+
+def _parse_node(v: str) -> NodeVersion | None:
+    """Parse a Node (semver 2.0.0) version string, ignoring a leading "v".
+
+    Pooled like _parse_python_version. Accepts exactly what semver.org's grammar
+    accepts and orders like it; build metadata is ignored.
 
     Args:
-        v1: First version string
-        v2: Second version string
+        v: Version string to parse
 
     Returns:
-        -1 if v1 < v2, 0 if equal, 1 if v1 > v2
-        Invalid versions are treated as less than valid versions
+        Comparable (major, minor, patch, is_release, prerelease) tuple if valid,
+        None otherwise
     """
-    p1, p2 = _parse_python_version(v1), _parse_python_version(v2)
-    if p1 is None and p2 is None:
-        return 0
-    if p1 is None:
-        return 1
-    if p2 is None:
-        return -1
-    if p1 < p2:
-        return -1
-    if p1 > p2:
-        return 1
-    return 0
-
-
-def _node_cmp(v1: str, v2: str) -> int:
-    try:
-        import semver
-        ver1 = semver.VersionInfo.parse(v1.lstrip("v"))
-        ver2 = semver.VersionInfo.parse(v2.lstrip("v"))
-        if ver1 < ver2:
-            return -1
-        if ver1 > ver2:
-            return 1
-        return 0
-    except Exception:
-        return 0
+    parsed = _NODE_POOL.get(v, _MISSING)
+    if parsed is not _MISSING:
+        return parsed
+    m = _SEMVER_RE.fullmatch(_strip_v(v))
+    if m is None:
+        parsed = None
+    else:
+        pre = m[4]
+        parsed = (
+            int(m[1]),
+            int(m[2]),
+            int(m[3]),
+            pre is None,
+            # Numeric identifiers sort numerically and before alphanumeric ones
+            tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in pre.split("."))
+            if pre
+            else (),
+        )
+    if len(_NODE_POOL) >= _POOL_MAX:
+        _NODE_POOL.clear()
+    _NODE_POOL[v] = parsed
+    return parsed
+
+
+def parse_version(v: str, ecosystem: Ecosystem) -> Any:
+    """Parse a version string for an ecosystem, reusing the process-wide pools.
+
+    Args:
+        v: Version string to parse
+        ecosystem: Package ecosystem (PEP 440 for Python, semver for Node)
+
+    Returns:
+        packaging Version (Python) or NodeVersion tuple (Node) if valid, None otherwise
+    """
+    if ecosystem == Ecosystem.PYTHON:
+        return _parse_python_version(v)
+    return _parse_node(v)
+
+
+def _sort_python_versions(versions: list[str]) -> list[str]:
+    """Sort Python versions ascending by PEP 440; invalid ones sort as version 0.
+
+    Keys are computed once per version and decorated onto the values
+    (Schwartzian transform), then projected back.
+    """
+    decorated = [(_parse_python_version(v) or _ZERO, v) for v in versions]
+    decorated.sort(key=itemgetter(0))
+    return [v for _, v in decorated]
+
+
+def _sort_node_versions(versions: list[str]) -> list[str]:
+    """Sort Node versions ascending by semver, or lexically if any is not semver."""
+    decorated = [(_parse_node(v), v) for v in versions]
+    if any(k is None for k, _ in decorated):
+        return sorted(versions)
+    decorated.sort(key=itemgetter(0))
+    return [v for _, v in decorated]
+
+
+def _major_prefix(v: str, ecosystem: Ecosystem) -> int | None:
+    """Major of a plain numeric version string, or None if it needs a full parse."""
+    m = (_PLAIN_PY_RE if ecosystem == Ecosystem.PYTHON else _PLAIN_NODE_RE).fullmatch(v)
+    return int(m.group(1)) if m else None
+
+
+def _major(v: str, ecosystem: Ecosystem) -> int | None:
+    """Major version number, or None if the version cannot be parsed.
+
+    Args:
+        v: Version string
+        ecosystem: Package ecosystem (affects version parsing)
+
+    Returns:
+        Major component as an int, None if parsing fails
+    """
+    m = _major_prefix(v, ecosystem)
+    if m is not None:
+        return m
+    if ecosystem == Ecosystem.PYTHON:
+        parsed = _parse_python_version(v)
+        return None if parsed is None else parsed.major
+    parsed = _parse_node(v)
+    return None if parsed is None else parsed[0]
 
 
 def _is_major_upgrade(installed: str, candidate: str, ecosystem: Ecosystem) -> bool:
@@ -106,18 +224,109 @@ def _is_major_upgrade(installed: str, candidate: str, ecosystem: Ecosystem) -> b
         True if candidate is a major version upgrade, False otherwise
         Returns True if version parsing fails (conservative approach)
     """
+    m1, m2 = _major(installed, ecosystem), _major(candidate, ecosystem)
+    # Conservative: assume major upgrade if parsing fails
+    return m1 is None or m2 is None or m1 != m2
+
+
+def _last_index_of(majors: list[int], major: int, monotone: bool) -> int | None:
+    """Index of the last entry equal to major, or None.
+
+    Majors of version-sorted candidates are normally non-decreasing, which
+    allows a bisect. Epochs and the lexical Node fallback can break that order
+    (monotone=False), in which case the list is scanned from the end instead.
+    """
+    if monotone:
+        i = bisect_right(majors, major) - 1
+        return i if i >= 0 and majors[i] == major else None
+    for i in range(len(majors) - 1, -1, -1):
+        if majors[i] == major:
+            return i
+    return None
+
+
+@dataclass(frozen=True)
+class SortedListing:
+    """One package's Artifactory versions, filtered and sorted once for many findings.
+
+    Build with precompute_artifactory() and pass to choose_best_version(listing=...)
+    for every finding of the package; only the installed and Snyk versions differ.
+
+    Attributes:
+        ecosystem: Package ecosystem the listing was built for
+        prefer_stable_only: Whether pre-releases were filtered out
+        candidates: Selectable versions, ascending (latest last)
+        rank: Version -> index in candidates
+        majors: Major of each candidate (-1 if unparseable)
+        majors_monotone: Whether majors is non-decreasing (bisect-able)
+        by_version: Whether candidates are in version order (False when Node
+            versions fell back to lexical order)
+        empty_reason: Why nothing is selectable, when candidates is empty
+    """
+
+    ecosystem: Ecosystem
+    prefer_stable_only: bool
+    candidates: list[str]
+    rank: dict[str, int]
+    majors: list[int]
+    majors_monotone: bool
+    by_version: bool
+    empty_reason: str | None = None
+
+
+def precompute_artifactory(
+    versions: Iterable[str],
+    ecosystem: Ecosystem,
+    prefer_stable_only: bool,
+) -> SortedListing:
+    """Filter and sort an Artifactory listing once for reuse across findings.
+
+    Args:
+        versions: Versions of the package available in Artifactory
+        ecosystem: Package ecosystem (PYTHON or NODE)
+        prefer_stable_only: Whether to filter out pre-release versions
+
+    Returns:
+        SortedListing for choose_best_version(listing=...)
+    """
+
+    def _empty(reason: str) -> SortedListing:
+        return SortedListing(ecosystem, prefer_stable_only, [], {}, [], True, True, reason)
+
+    # Interned so membership tests against (interned) Snyk fix versions in
+    # choose_best_version hit the identity fast path of the rank dict
+    candidates = list({sys.intern(v) for v in versions})
+    if not candidates:
+        return _empty("No versions available in Artifactory")
+    if prefer_stable_only:
+        candidates = filter_prereleases(candidates, ecosystem)
+    if not candidates:
+        return _empty("No stable versions in Artifactory after filtering pre-releases")
+
+    # Sort ascending so "latest" = last element
+    by_version = True
     if ecosystem == Ecosystem.PYTHON:
-        p1, p2 = _parse_python_version(installed), _parse_python_version(candidate)
-        if p1 is None or p2 is None:
-            return True  # Conservative: assume major upgrade if parsing fails
-        return p1.major != p2.major
-    try:
-        import semver
-        v1 = semver.VersionInfo.parse(installed.lstrip("v"))
-        v2 = semver.VersionInfo.parse(candidate.lstrip("v"))
-        return v1.major != v2.major
-    except Exception:
-        return True  # Conservative: assume major upgrade if parsing fails
+        # Versions pip could not resolve are never worth choosing; dropping them
+        # up front also means the sort key needs no fallback for None
+        candidates = [c for c in candidates if _parse_python_version(c) is not None]
+        if not candidates:
+            return _empty("No valid PEP 440 versions in Artifactory")
+        candidates.sort(key=_parse_python_version)
+    else:
+        by_version = all(_parse_node(c) is not None for c in candidates)
+        candidates = _sort_node_versions(candidates)
+    # -1 stands in for unparseable versions; it never equals a real major
+    majors = [-1 if m is None else m for m in (_major(c, ecosystem) for c in candidates)]
+    return SortedListing(
+        ecosystem=ecosystem,
+        prefer_stable_only=prefer_stable_only,
+        candidates=candidates,
+        # Position in the sorted candidates doubles as the sort key for any subset of them
+        rank={v: i for i, v in enumerate(candidates)},
+        majors=majors,
+        majors_monotone=all(a <= b for a, b in zip(majors, majors[1:])),
+        by_version=by_version,
+    )
 
 
 def choose_best_version(
@@ -127,6 +336,7 @@ def choose_best_version(
     allow_major: bool,
     prefer_stable_only: bool,
     ecosystem: Ecosystem,
+    listing: SortedListing | None = None,
 ) -> Tuple[str | None, str]:
     """Select the best upgrade version from available options.
 
@@ -143,59 +353,101 @@ def choose_best_version(
         allow_major: Whether to allow major version upgrades
         prefer_stable_only: Whether to filter out pre-release versions
         ecosystem: Package ecosystem (PYTHON or NODE)
+        listing: Precomputed artifactory_versions (see precompute_artifactory); when
+            given, artifactory_versions is ignored
 
     Returns:
         Tuple of (selected_version, reason_string)
         - selected_version: Best version to upgrade to, or None if no suitable version
         - reason: Human-readable explanation of why this version was chosen
 
+    Raises:
+        ValueError: If listing was built for another ecosystem or stability policy
+
     Example:
         If Snyk recommends 3.9 but Artifactory only has up to 3.7,
         this function will return 3.7 with reason explaining that Snyk's
         version wasn't available, so latest in Artifactory was used.
     """
     installed = (installed_version or "0").strip()
-    cmp_fn = _python_cmp if ecosystem == Ecosystem.PYTHON else _node_cmp
-    af_set = set(artifactory_versions)
-    if not af_set:
-        return None, "No versions available in Artifactory"
+    if listing is None:
+        # Artifactory versions are deduplicated and re-sorted, so a frozenset key is
+        # order-independent; fix version order can break ties, so it is kept
+        return _choose_cached(
+            installed,
+            tuple(snyk_fix_versions),
+            frozenset(artifactory_versions),
+            allow_major,
+            prefer_stable_only,
+            ecosystem,
+        )
+    if listing.ecosystem != ecosystem or listing.prefer_stable_only != prefer_stable_only:
+        raise ValueError("listing was built for a different ecosystem or prefer_stable_only")
+    return _choose_from_listing(installed, snyk_fix_versions, allow_major, ecosystem, listing)
+
+
+@lru_cache(maxsize=2048)
+def _choose_cached(
+    installed: str,
+    snyk_fix_versions: tuple[str, ...],
+    artifactory_versions: frozenset[str],
+    allow_major: bool,
+    prefer_stable_only: bool,
+    ecosystem: Ecosystem,
+) -> Tuple[str | None, str]:
+    """choose_best_version without a listing, memoized for findings with identical inputs."""
+    listing = precompute_artifactory(artifactory_versions, ecosystem, prefer_stable_only)
+    return _choose_from_listing(installed, snyk_fix_versions, allow_major, ecosystem, listing)
 
-    candidates = list(af_set)
-    if prefer_stable_only:
-        candidates = filter_prereleases(candidates, ecosystem)
-    if not candidates:
-        return None, "No stable versions in Artifactory after filtering pre-releases"
 
-    # Sort ascending so "latest" = last element
-    if ecosystem == Ecosystem.PYTHON:
-        candidates.sort(key=lambda x: (_parse_python_version(x) or PyVersion("0")))
-    else:
-        try:
-            import semver
-            candidates.sort(key=lambda x: semver.VersionInfo.parse(x.lstrip("v")))
-        except Exception:
-            candidates.sort()
-
-    # 1) Prefer Snyk fix versions that exist in Artifactory (use smallest that fixes)
-    snyk_in_af = [s for s in snyk_fix_versions if s in af_set and (not prefer_stable_only or s in candidates)]
-    if ecosystem == Ecosystem.PYTHON:
-        snyk_in_af.sort(key=lambda x: (_parse_python_version(x) or PyVersion("0")))
-    else:
-        try:
-            import semver
-            snyk_in_af.sort(key=lambda x: semver.VersionInfo.parse(x.lstrip("v")))
-        except Exception:
-            snyk_in_af.sort()
-    for snyk_ver in snyk_in_af:
-        if not allow_major and _is_major_upgrade(installed, snyk_ver, ecosystem):
-            continue
-        return snyk_ver, "Snyk fix version available in Artifactory"
+def _choose_from_listing(
+    installed: str,
+    snyk_fix_versions: Iterable[str],
+    allow_major: bool,
+    ecosystem: Ecosystem,
+    listing: SortedListing,
+) -> Tuple[str | None, str]:
+    """Core of choose_best_version once the Artifactory listing is sorted.
+
+    Args:
+        installed: Installed version, already defaulted and stripped
+        snyk_fix_versions: Versions Snyk recommends
+        allow_major: Whether to allow major version upgrades
+        ecosystem: Package ecosystem (PYTHON or NODE)
+        listing: Artifactory listing matching ecosystem and the stability policy
+
+    Returns:
+        Tuple of (selected_version or None, reason)
+    """
+    if listing.empty_reason is not None:
+        return None, listing.empty_reason
+    candidates, rank, majors = listing.candidates, listing.rank, listing.majors
+
+    # Parsed once; a candidate is in the same major iff its major equals this.
+    # None (unparseable installed version) makes every candidate a major upgrade.
+    installed_major = None if allow_major else _major(installed, ecosystem)
+
+    # 1) Prefer Snyk fix versions that exist in Artifactory (use smallest that fixes).
+    # Candidates are af_set after the optional pre-release filter, so rank covers both
+    # tests; the common "Snyk's version is not mirrored" case skips this block entirely.
+    if not rank.keys().isdisjoint(snyk_fix_versions):
+        snyk_in_af = [s for s in dict.fromkeys(snyk_fix_versions) if s in rank]
+        if listing.by_version:
+            snyk_in_af.sort(key=rank.__getitem__)
+        else:
+            # Candidates fell back to lexical order, which is not semver order for the subset
+            snyk_in_af = _sort_node_versions(snyk_in_af)
+        for snyk_ver in snyk_in_af:
+            if not allow_major and (installed_major is None or majors[rank[snyk_ver]] != installed_major):
+                continue
+            return snyk_ver, "Snyk fix version available in Artifactory"
 
     # 2) Snyk's requested version(s) not in Artifactory → use latest available in Artifactory
     #    so the tool can actually download the package (e.g. Snyk says 3.9, Artifactory has 3.7 → use 3.7)
-    for c in reversed(candidates):
-        if allow_major:
-            return c, "Latest in Artifactory (Snyk requested version not available)"
-        if not _is_major_upgrade(installed, c, ecosystem):
-            return c, "Latest in Artifactory (Snyk requested version not available)"
+    if allow_major:
+        return candidates[-1], "Latest in Artifactory (Snyk requested version not available)"
+    if installed_major is not None:
+        idx = _last_index_of(majors, installed_major, listing.majors_monotone)
+        if idx is not None:
+            return candidates[idx], "Latest in Artifactory (Snyk requested version not available)"
     return None, "No suitable version (major upgrade disallowed or no candidate)"
@@ -0,0 +1,69 @@
+"""Tests for Artifactory response parsing."""
+
+from pathlib import Path
+
+import pytest
+
+from dep_patchflow import artifactory
+from dep_patchflow.artifactory import _sort_node, _sort_python, _versions_from_aql
+from dep_patchflow.models import Ecosystem
+
+
+def test_aql_pypi_layout() -> None:
+    data = {
+        "results": [
+            {"path": "pypi/requests/2.31.0", "name": "requests-2.31.0-py3-none-any.whl"},
+            {"path": "pypi/requests/2.28.0", "name": "requests-2.28.0-py3-none-any.whl"},
+            {"path": "pypi/urllib3/2.0.0", "name": "urllib3-2.0.0-py3-none-any.whl"},
+        ]
+    }
+    assert _versions_from_aql(data, Ecosystem.PYTHON, "requests") == ["2.28.0", "2.31.0"]
+
+
+def test_aql_npm_layout() -> None:
+    data = {
+        "results": [
+            {"path": "axios/-", "name": "axios-1.6.0.tgz"},
+            {"path": "axios/-", "name": "axios-0.21.1.tgz"},
+        ]
+    }
+    assert _versions_from_aql(data, Ecosystem.NODE, "axios") == ["0.21.1", "1.6.0"]
+
+
+def test_aql_npm_ignores_longer_package_names() -> None:
+    data = {
+        "results": [
+            {"path": "npm/preact/-", "name": "preact-10.0.0.tgz"},
+            {"path": "npm/react/-", "name": "react-18.2.0.tgz"},
+        ]
+    }
+    assert _versions_from_aql(data, Ecosystem.NODE, "react") == ["18.2.0"]
+
+
+def test_aql_repeated_package_segment() -> None:
+    data = {"results": [{"path": "repo/pkg/pkg/9.0", "name": "pkg-9.0.tar.gz"}]}
+    # The version follows the second "pkg" segment, which overlaps the first match
+    assert "9.0" in _versions_from_aql(data, Ecosystem.PYTHON, "pkg")
+
+
+def test_aql_empty_results() -> None:
+    assert _versions_from_aql({}, Ecosystem.PYTHON, "requests") == []
+
+
+def test_sort_helpers() -> None:
+    assert _sort_python(["2.0", "1.10", "1.9"]) == ["1.9", "1.10", "2.0"]
+    assert _sort_node(["1.10.0", "v1.9.0", "1.10.0-rc.1"]) == ["v1.9.0", "1.10.0-rc.1", "1.10.0"]
+
+
+def test_disk_cache_expiry_and_corrupt_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(artifactory, "_disk_cache_path", tmp_path / "versions.sqlite")
+    artifactory._disk_cache_put("src", "python", "requests", ["2.31.0"])
+    assert artifactory._disk_cache_get("src", "python", "requests", ttl=3600) == ["2.31.0"]
+    # Listings older than the TTL are refetched rather than trusted forever
+    assert artifactory._disk_cache_get("src", "python", "requests", ttl=-1) is None
+    with artifactory._disk_lock:
+        conn = artifactory._disk_connect()
+        with conn:
+            conn.execute("UPDATE versions SET versions_json = '{not json'")
+    assert artifactory._disk_cache_get("src", "python", "requests", ttl=3600) is None
+    artifactory._close_disk_cache()
@@ -0,0 +1,23 @@
+"""Tests for settings loading."""
+
+from pathlib import Path
+
+import pytest
+
+from dep_patchflow.config import Settings
+
+
+def test_from_yaml_reads_env_on_every_call(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cfg = tmp_path / "config.yml"
+    cfg.write_text('artifactory_token: "${DP_TEST_TOKEN}"\npolicy:\n  allow_major: true\n')
+    monkeypatch.setenv("DP_TEST_TOKEN", "first")
+    monkeypatch.setenv("ARTIFACTORY_REPO_NPM", "npm-a")
+    first = Settings.from_yaml(cfg)
+    assert (first.artifactory_token, first.artifactory_repo_npm) == ("first", "npm-a")
+    assert first.get_policy().allow_major is True
+
+    # The file is unchanged (cached parse), but the environment is not
+    monkeypatch.setenv("DP_TEST_TOKEN", "second")
+    monkeypatch.setenv("ARTIFACTORY_REPO_NPM", "npm-b")
+    second = Settings.from_yaml(cfg)
+    assert (second.artifactory_token, second.artifactory_repo_npm) == ("second", "npm-b")
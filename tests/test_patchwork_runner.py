@@ -0,0 +1,77 @@
+"""Tests for manifest updates and Patchwork invocation."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from dep_patchflow.models import Ecosystem, UpgradeItem, UpgradePlan
+from dep_patchflow.patchwork_runner import _run_patchwork_cmd, apply_manifest_updates
+
+
+def _plan(*items: tuple[str, str, Ecosystem]) -> UpgradePlan:
+    return UpgradePlan(
+        upgrades=[
+            UpgradeItem(package=p, from_version="0", to_version=v, ecosystem=e, reason="test")
+            for p, v, e in items
+        ]
+    )
+
+
+def test_requirements_case_insensitive(tmp_path: Path) -> None:
+    req = tmp_path / "requirements.txt"
+    req.write_text("# pinned\nRequests==2.0.0\nflask>=1.0\n\n", encoding="utf-8")
+    plan = _plan(("requests", "2.31.0", Ecosystem.PYTHON))
+    assert apply_manifest_updates(plan, tmp_path) == [str(req)]
+    assert req.read_text(encoding="utf-8") == "# pinned\nrequests==2.31.0\nflask>=1.0\n\n"
+
+
+def test_requirements_untouched_without_match(tmp_path: Path) -> None:
+    req = tmp_path / "requirements.txt"
+    req.write_text("flask>=1.0\n", encoding="utf-8")
+    plan = _plan(("requests", "2.31.0", Ecosystem.PYTHON))
+    assert apply_manifest_updates(plan, tmp_path) == []
+    assert req.read_text(encoding="utf-8") == "flask>=1.0\n"
+
+
+def test_requirements_other_specifiers(tmp_path: Path) -> None:
+    req = tmp_path / "requirements.txt"
+    req.write_text("urllib3[socks]!=1.25.0\n-r base.txt\nidna<3\n", encoding="utf-8")
+    plan = _plan(("urllib3", "2.0.7", Ecosystem.PYTHON), ("idna", "3.7", Ecosystem.PYTHON))
+    apply_manifest_updates(plan, tmp_path)
+    assert req.read_text(encoding="utf-8") == "urllib3==2.0.7\n-r base.txt\nidna==3.7\n"
+
+
+def test_run_patchwork_cmd_streams_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    script = tmp_path / "patchwork"
+    script.write_text('#!/bin/sh\necho "running $1"\necho oops >&2\nexit 3\n', encoding="utf-8")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    result = _run_patchwork_cmd("AutoFix", "sk-test", tmp_path, timeout=30)
+    assert result is not None
+    assert (result.returncode, result.stdout, result.stderr) == (3, "running AutoFix", "oops")
+
+
+def test_run_patchwork_cmd_missing_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert _run_patchwork_cmd("AutoFix", "sk-test", tmp_path) is None
+
+
+def test_missing_project_dir(tmp_path: Path) -> None:
+    plan = _plan(("requests", "2.31.0", Ecosystem.PYTHON))
+    assert apply_manifest_updates(plan, tmp_path / "missing") == []
+
+
+def test_package_json_caret_update(tmp_path: Path) -> None:
+    pkg = tmp_path / "package.json"
+    pkg.write_text(
+        '{\n  "name": "app",\n  "dependencies": {\n    "axios": "^0.21.0",\n    "ms": "2.1.3"\n  },\n'
+        '  "devDependencies": {\n    "axios": "0.21.0"\n  }\n}\n',
+        encoding="utf-8",
+    )
+    plan = _plan(("axios", "1.6.0", Ecosystem.NODE), ("lodash", "4.17.21", Ecosystem.NODE))
+    assert apply_manifest_updates(plan, tmp_path) == [str(pkg)]
+    assert pkg.read_text(encoding="utf-8") == (
+        '{\n  "name": "app",\n  "dependencies": {\n    "axios": "^1.6.0",\n    "ms": "2.1.3"\n  },\n'
+        '  "devDependencies": {\n    "axios": "^1.6.0"\n  }\n}\n'
+    )
@@ -0,0 +1,49 @@
+"""Tests for upgrade plan building (Artifactory lookups stubbed)."""
+
+import pytest
+
+from dep_patchflow import planner
+from dep_patchflow.config import Settings
+from dep_patchflow.models import Ecosystem, Finding, Severity
+
+
+def _finding(name: str, severity: str, fix_versions: list[str] | None = None) -> Finding:
+    return Finding(
+        ecosystem=Ecosystem.PYTHON,
+        package_name=name,
+        installed_version="1.0.0",
+        severity=severity,
+        fix_versions=fix_versions or [],
+    )
+
+
+def test_build_plan_orders_and_filters(monkeypatch: pytest.MonkeyPatch) -> None:
+    listed: list[tuple[str, Ecosystem]] = []
+
+    def _prefetch(names: list[tuple[str, Ecosystem]], settings: Settings) -> dict:
+        listed.extend(names)
+        return {k: ["1.0.0", "1.5.0", "2.0.0"] for k in names}
+
+    monkeypatch.setattr(planner, "existing_versions", lambda name, eco, wanted, settings: ["1.2.0"])
+    monkeypatch.setattr(planner, "prefetch_versions", _prefetch)
+    findings = [
+        _finding("zlib", "high", ["1.2.0"]),
+        _finding("attrs", "low"),
+        _finding("bcrypt", "critical"),
+    ]
+    plan = planner.build_plan(findings, Settings())
+
+    assert [(u.package, u.to_version) for u in plan.upgrades] == [("bcrypt", "1.5.0"), ("zlib", "1.2.0")]
+    assert [(s.package, s.severity) for s in plan.skipped] == [("attrs", Severity.LOW)]
+    # zlib was settled by the HEAD check; only bcrypt needed a full listing
+    assert listed == [("bcrypt", Ecosystem.PYTHON)]
+
+
+def test_copied_finding_severity_drives_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(planner, "existing_versions", lambda name, eco, wanted, settings: [])
+    monkeypatch.setattr(planner, "prefetch_versions", lambda names, settings: {k: ["1.5.0"] for k in names})
+    # model_copy skips validation; the rank must still follow the new severity
+    escalated = _finding("attrs", "low").model_copy(update={"severity": Severity.CRITICAL})
+    assert escalated.severity_rank == 3
+    plan = planner.build_plan([_finding("zlib", "high"), escalated], Settings())
+    assert [u.package for u in plan.upgrades] == ["attrs", "zlib"]
@@ -0,0 +1,38 @@
+"""Tests for plan report generation."""
+
+import json
+from pathlib import Path
+
+from dep_patchflow.models import Ecosystem, Severity, SkippedItem, UpgradeItem, UpgradePlan
+from dep_patchflow.reporting import write_reports
+
+
+def _plan() -> UpgradePlan:
+    return UpgradePlan(
+        upgrades=[
+            UpgradeItem(
+                package="requests", from_version="2.0.0", to_version="2.31.0",
+                ecosystem=Ecosystem.PYTHON, reason="Snyk fix in Artifactory",
+            )
+        ],
+        skipped=[
+            SkippedItem(
+                package="axios", from_version=None, ecosystem=Ecosystem.NODE,
+                reason="No fix version in Artifactory", severity=Severity.HIGH,
+            )
+        ],
+    )
+
+
+def test_json_report_uses_enum_values(tmp_path: Path) -> None:
+    json_path, _ = write_reports(_plan(), tmp_path)
+    payload = json.loads(json_path.read_text(encoding="utf-8"))
+    assert payload["summary"]["upgrades_count"] == 1
+    assert payload["upgrades"][0]["ecosystem"] == "python"
+    assert payload["skipped"][0] == {
+        "package": "axios",
+        "from_version": None,
+        "ecosystem": "node",
+        "reason": "No fix version in Artifactory",
+        "severity": "high",
+    }
@@ -1,11 +1,13 @@
 """Tests for Snyk JSON parser."""
 
+import io
 import json
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from dep_patchflow import snyk_parser
 from dep_patchflow.models import Ecosystem, Severity
 from dep_patchflow.snyk_parser import parse_snyk_json
 
@@ -98,3 +100,67 @@ def test_parse_invalid_json() -> None:
         assert findings == []
     finally:
         Path(path).unlink(missing_ok=True)
+
+
+def test_parse_bytes() -> None:
+    data = {
+        "vulnerabilities": [
+            {"packageName": "lodash", "version": "4.17.20", "severity": "high", "upgradePath": ["lodash@4.17.21"]}
+        ],
+        "packageManager": "npm",
+    }
+    findings = parse_snyk_json(json.dumps(data).encode())
+    assert len(findings) == 1
+    assert findings[0].ecosystem == Ecosystem.NODE
+    assert findings[0].fix_versions == ["4.17.21"]
+    assert parse_snyk_json(b"not json") == []
+
+
+@pytest.mark.parametrize("stream_min_bytes", [0, snyk_parser._STREAM_MIN_BYTES])
+def test_parse_invalid_utf8_in_string(monkeypatch: pytest.MonkeyPatch, stream_min_bytes: int) -> None:
+    monkeypatch.setattr(snyk_parser, "_STREAM_MIN_BYTES", stream_min_bytes)
+    raw = (
+        b'{"vulnerabilities": [{"packageName": "foo", "version": "1.0", "severity": "high", '
+        b'"title": "bad \xff byte"}], "packageManager": "pip"}'
+    )
+    assert [f.package_name for f in parse_snyk_json(raw)] == ["foo"]
+    assert [f.package_name for f in parse_snyk_json(io.BytesIO(raw))] == ["foo"]
+
+
+def test_parse_file_object() -> None:
+    data = {"vulnerabilities": [{"packageName": "foo", "version": "1.0", "severity": "low"}], "packageManager": "pip"}
+    findings = parse_snyk_json(io.BytesIO(json.dumps(data).encode()))
+    assert [f.package_name for f in findings] == ["foo"]
+    assert findings[0].severity == Severity.LOW
+
+
+def test_parse_stream_metadata_after_array(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(snyk_parser, "_STREAM_MIN_BYTES", 0)
+    data = {
+        "vulnerabilities": [
+            {"packageName": "axios", "version": "0.21.0", "severity": "high", "cvssScore": 7.5},
+            {"packageName": "axios", "version": "0.21.0", "severity": "high"},
+        ],
+        "ok": False,
+        "packageManager": "yarn",
+    }
+    findings = parse_snyk_json(io.BytesIO(json.dumps(data).encode()))
+    assert len(findings) == 1
+    assert findings[0].ecosystem == Ecosystem.NODE
+    assert parse_snyk_json(io.BytesIO(b'{"vulnerabilities": [')) == []
+
+
+def test_parse_file_cached_until_modified(tmp_path: Path) -> None:
+    path = tmp_path / "snyk.json"
+    path.write_text(json.dumps({"vulnerabilities": [{"packageName": "foo", "version": "1.0"}]}))
+    first = parse_snyk_json(path)
+    second = parse_snyk_json(path)
+    assert first == second and first is not second
+    assert first[0] is second[0]
+    path.write_text(json.dumps({"vulnerabilities": [{"packageName": "barbaz", "version": "2.0"}]}))
+    assert [f.package_name for f in parse_snyk_json(path)] == ["barbaz"]
+
+
+def test_fix_versions_deduped_across_keys() -> None:
+    vuln = {"upgradePath": [False, "a@1.2", "a@1.3", "a@false"], "fixedIn": ["1.3", " 1.4 ", None]}
+    assert snyk_parser._extract_fix_versions(vuln) == ["1.2", "1.3", "1.4"]
@@ -4,8 +4,11 @@ import pytest
 
 from dep_patchflow.models import Ecosystem
 from dep_patchflow.version_policy import (
+    _choose_cached,
     choose_best_version,
     filter_prereleases,
+    parse_version,
+    precompute_artifactory,
 )
 
 
@@ -18,6 +21,11 @@ def test_filter_prereleases_python() -> None:
     assert "1.1.0b0" not in out
 
 
+def test_filter_prereleases_all_stable_returns_input() -> None:
+    versions = ["1.0.0", "1.1.0", "2.0.0"]
+    assert filter_prereleases(versions, Ecosystem.NODE) is versions
+
+
 def test_choose_best_snyk_in_artifactory() -> None:
     selected, reason = choose_best_version(
         "1.0.0",
@@ -67,3 +75,55 @@ def test_choose_best_major_allowed() -> None:
         ecosystem=Ecosystem.PYTHON,
     )
     assert selected == "2.0.0"
+
+
+def test_choose_best_node_semver_order() -> None:
+    selected, reason = choose_best_version(
+        "1.2.0",
+        [],
+        ["1.9.0", "1.10.0", "v1.3.0", "2.0.0"],
+        allow_major=False,
+        prefer_stable_only=True,
+        ecosystem=Ecosystem.NODE,
+    )
+    assert selected == "1.10.0"
+    assert "Latest" in reason
+
+
+def test_parse_version_pooled() -> None:
+    assert parse_version("1.2.3", Ecosystem.PYTHON) is parse_version("1.2.3", Ecosystem.PYTHON)
+    assert parse_version("v1.2.3", Ecosystem.NODE)[0] == 1
+    assert parse_version("not-a-version", Ecosystem.PYTHON) is None
+    assert parse_version("1.2", Ecosystem.NODE) is None
+    assert parse_version("vv1.2.3", Ecosystem.NODE) is None
+
+
+def test_choose_best_ignores_invalid_python_versions() -> None:
+    selected, _ = choose_best_version(
+        "1.0.0",
+        ["latest"],
+        ["latest", "1.4.0", "not a version"],
+        allow_major=True,
+        prefer_stable_only=False,
+        ecosystem=Ecosystem.PYTHON,
+    )
+    assert selected == "1.4.0"
+
+
+def test_choose_best_with_shared_listing() -> None:
+    listing = precompute_artifactory(["1.1.0", "1.2.0", "2.0.0", "2.1.0rc1"], Ecosystem.PYTHON, True)
+    assert listing.candidates == ["1.1.0", "1.2.0", "2.0.0"]
+    for installed, fixes, expected in [("1.0.0", ["1.2.0"], "1.2.0"), ("1.0.0", [], "1.2.0"), ("2.0.0", [], "2.0.0")]:
+        selected, _ = choose_best_version(installed, fixes, [], False, True, Ecosystem.PYTHON, listing=listing)
+        assert selected == expected
+    with pytest.raises(ValueError):
+        choose_best_version("1.0.0", [], [], False, False, Ecosystem.PYTHON, listing=listing)
+
+
+def test_choose_best_memoizes_identical_inputs() -> None:
+    args = (["3.1.0"], ["3.0.0", "3.1.0", "3.2.0"], False, True, Ecosystem.PYTHON)
+    first = choose_best_version("3.0.0", *args)
+    hits = _choose_cached.cache_info().hits
+    # Artifactory listing order does not affect the result, so it shares the entry
+    assert choose_best_version("3.0.0", args[0], args[1][::-1], *args[2:]) == first == ("3.1.0", first[1])
+    assert _choose_cached.cache_info().hits == hits + 1